@@ -1,3 +1,3 @@
-from .parser import InfoboxParser, parse_all
+from .parser import InfoboxParser, parse_all, parse_artist, parse_infobox
 from .cleaner import DataCleaner, clean_all
-__all__ = ['InfoboxParser', 'parse_all', 'DataCleaner', 'clean_all']
+__all__ = ['InfoboxParser', 'parse_all', 'parse_artist', 'parse_infobox', 'DataCleaner', 'clean_all']
@@ -1,305 +1,326 @@
-import json
+import itertools
+import multiprocessing
 import re
-from typing import Dict, List, Optional, Any
+import sys
+from typing import Callable, Dict, BinaryIO, Iterable, Iterator, List, Optional, Tuple, Any
+from functools import lru_cache
 import mwparserfromhell
+import ijson
+import orjson
 from data_collection.utils import logger, clean_text
+_WIKITEXT_PARSER = mwparserfromhell.parser.Parser()
+_GENRE_PATTERNS = ('thể loại', 'genre', 'loại nhạc', 'thể_loại')
+_INSTRUMENT_PATTERNS = ('nhạc cụ', 'instruments', 'instrument', 'nhạc_cụ')
+_YEARS_PATTERNS = ('năm hoạt động', 'years active', 'years_active', 'năm_hoạt_động')
+_ALBUM_PATTERNS = ('album', 'albums', 'discography', 'đĩa nhạc')
+_LABEL_PATTERNS = ('label', 'labels', 'record label', 'record_label', 'nhãn đĩa', 'nhãn_đĩa')
+_FIELDS = (('genres', _GENRE_PATTERNS), ('instruments', _INSTRUMENT_PATTERNS), ('active_years', _YEARS_PATTERNS), ('albums', _ALBUM_PATTERNS), ('labels', _LABEL_PATTERNS))
+_FIELD_PATTERNS = {pattern: field for field, patterns in reversed(_FIELDS) for pattern in patterns}
+_FIELD_RANK = {field: rank for rank, (field, _) in enumerate(_FIELDS)}
+_RE_FIELD = re.compile('(?=(' + '|'.join((re.escape(pattern) for _, patterns in _FIELDS for pattern in patterns)) + '))')
+_FALSE_POSITIVES = frozenset({'yes', 'no', 'all', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten', 'ref', 'web', 'review', 'citation', 'billboard', 'magic', 'week', 'list', 'index', 'title', 'name', 'album', 'song'})
+_GENERIC_WORDS = frozenset({'book', 'chapter', 'part', 'section', 'volume', 'edition', 'version', 'demo', 'remix', 'edit', 'mix', 'cut', 'single', 'album', 'ep', 'lp', 'cd', 'tape', 'record'})
+_OVERLY_COMMON = frozenset({'celebration', 'greatest hits', 'best of', 'collection', 'anthology', 'greatest hits album', 'best of album'})
+_ONLY_COMMON = frozenset({'the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for'})
+_BAD_FIRST_CHARS = frozenset('([{/\\-_|*')
+_BAD_LAST_CHARS = frozenset('([{/\\|*')
+_RE_BAD_ALBUM = re.compile('^đầu tay\\s|^tư\\s|^ng\\s|^của\\s|^được\\s|^là\\s|^có\\s|^trong\\s|^với\\s|^theo\\s|^từ\\s|nh tên|a cô|ng tên|tên cô|^\\s*+album\\s++của\\s|^\\s*+đĩa nhạc\\s++của\\s|^(?:to\\s[A-Z][a-z]++$|a\\s[A-Z][a-z]++$|an\\s[A-Z][a-z]++$|the\\s[A-Z][a-z]++$|by\\s[A-Z]|of\\s[A-Z]|from\\s[A-Z]|with\\s[A-Z]|album\\s++by\\s|album\\s++of\\s|song\\s++by\\s|single\\s++by\\s)|\\s\\(album\\s++(?:của|by|of)', re.IGNORECASE)
+_INTERNED_FIELDS = ('genres', 'instruments', 'labels')
+_RE_TRAILING_YEAR = re.compile('\\s*\\(\\d{4}\\)\\s*$')
+_GENRE_NORMALIZATIONS = {'r&b': 'R&B', 'r & b': 'R&B', 'r and b': 'R&B', 'nhạc pop': 'pop', 'nhạc rock': 'rock', 'nhạc soul': 'soul', 'nhạc dance': 'dance', 'nhạc hip hop': 'hip hop', 'nhạc rap': 'rap', 'nhạc country': 'country', 'nhạc jazz': 'jazz', 'nhạc blues': 'blues', 'nhạc electronic': 'electronic', 'nhạc folk': 'folk', 'nhạc alternative': 'alternative', 'dance-pop': 'dance pop', 'pop-rock': 'pop rock', 'rock-pop': 'rock pop', 'hip-hop': 'hip hop', 'hip hop': 'hip hop', 'r&b đương đại': 'contemporary R&B', 'r&b contemporary': 'contemporary R&B', 'contemporary r&b': 'contemporary R&B', 'blue-eyed soul': 'blue eyed soul', 'funk-pop': 'funk pop', 'acoustic rock': 'acoustic rock', 'blues rock': 'blues rock', 'pop dân gian': 'folk pop', 'pop folk': 'folk pop'}
+_LOWERCASE_GENRE_WORDS = frozenset({'r&b', 'pop', 'edm', 'idm'})
+_ITEM_STRIP_CHARS = '*{}|' + ''.join((chr(c) for c in range(12289) if chr(c).isspace()))
+_RE_SCAN_TOKEN = re.compile('\\{\\{|\\}\\}|\\[\\[|\\]\\]|\\|')
+_RE_SCAN_UNSAFE = re.compile('<(?!br\\s*/?>)|(?<!\\[)\\[(?!\\[)|\\{\\{\\{|\\{\\|', re.IGNORECASE)
+_MARKUP_CHARS = frozenset('<[\'{')
+_RE_CLEANUP = re.compile('(?P<ref><ref(?:\\s[^>]*+)?(?<!/)>.*?</ref>)|(?P<link>\\[\\[(?:[^\\]|]++\\|)?(?P<link_text>[^\\]]++)\\]\\])|(?P<bold>\'\'\'?+(?P<bold_text>[^\']++)\'\'\'?)|(?P<template>\\{\\{[^}]++\\}\\})|(?P<tag><[^>]++>)', re.DOTALL)
+_LIST_SEPARATORS = str.maketrans(dict.fromkeys(',;•|', '\n'))
+_RE_ALBUM_TOKEN = re.compile('(?:[^,;\\n•|–—\\-]|-(?!\\s*[A-ZĂÂÊÔƠƯĐ]))+')
 
-class InfoboxParser:
+def _scan_field(param_name: str) -> Optional[str]:
+    matches = _RE_FIELD.findall(param_name)
+    if not matches:
+        return None
+    return min((_FIELD_PATTERNS[match] for match in matches), key=_FIELD_RANK.__getitem__)
+_FIELD_EXACT = {pattern: _scan_field(pattern) for pattern in _FIELD_PATTERNS}
 
-    def __init__(self):
-        self.genre_patterns = ['thể loại', 'genre', 'loại nhạc', 'thể_loại']
-        self.instrument_patterns = ['nhạc cụ', 'instruments', 'instrument', 'nhạc_cụ']
-        self.years_patterns = ['năm hoạt động', 'years active', 'years_active', 'năm_hoạt_động']
-        self.album_patterns = ['album', 'albums', 'discography', 'đĩa nhạc']
-        self.label_patterns = ['label', 'labels', 'record label', 'record_label', 'nhãn đĩa', 'nhãn_đĩa']
+def _iter_artists(input_path: str) -> Iterator[Dict]:
+    with open(input_path, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
 
-    def parse_infobox(self, infobox_text: str) -> Dict[str, Any]:
-        if not infobox_text:
-            return {}
-        try:
-            wikicode = mwparserfromhell.parse(infobox_text)
+def _split_list(field_value: str) -> List[str]:
+    return field_value.translate(_LIST_SEPARATORS).split('\n')
+
+def _cleanup_replace(match: re.Match) -> str:
+    if match.lastgroup == 'link':
+        return _RE_CLEANUP.sub(_cleanup_replace, match.group('link_text'))
+    if match.lastgroup == 'bold':
+        return _RE_CLEANUP.sub(_cleanup_replace, match.group('bold_text'))
+    return ''
+
+@lru_cache(maxsize=1024)
+def _match_field(param_name: str) -> Optional[str]:
+    param_name = param_name.strip().lower()
+    field = _FIELD_EXACT.get(param_name)
+    if field is not None:
+        return field
+    return _scan_field(param_name)
+
+def _scan_template_params(infobox_text: str) -> Optional[List[Tuple[str, str, None]]]:
+    if _RE_SCAN_UNSAFE.search(infobox_text):
+        return None
+    start = infobox_text.find('{{')
+    if start < 0:
+        return None
+    pieces = []
+    depth = links = 0
+    last = start + 2
+    for match in _RE_SCAN_TOKEN.finditer(infobox_text, start):
+        token = match.group()
+        if token == '{{':
+            depth += 1
+        elif token == '}}':
+            depth -= 1
+            if depth == 0:
+                if links:
+                    return None
+                pieces.append(infobox_text[last:match.start()])
+                break
+        elif token == '[[':
+            links += 1
+        elif token == ']]':
+            if links:
+                links -= 1
+        elif depth == 1 and (not links):
+            pieces.append(infobox_text[last:match.start()])
+            last = match.end()
+    else:
+        return None
+    params = []
+    for piece in pieces[1:]:
+        eq = piece.find('=')
+        nested = min((i for i in (piece.find('{{'), piece.find('[[')) if i >= 0), default=-1)
+        if nested >= 0 and (eq < 0 or nested < eq):
+            return None
+        if eq >= 0:
+            params.append((piece[:eq], piece[eq + 1:], None))
+    return params
+
+def parse_infobox(infobox_text: str) -> Dict[str, Any]:
+    if not infobox_text:
+        return {}
+    try:
+        params = _scan_template_params(infobox_text)
+        if params is None:
+            wikicode = _WIKITEXT_PARSER.parse(infobox_text)
             templates = wikicode.filter_templates()
             if not templates:
                 return {}
-            template = templates[0]
-            data = {'genres': [], 'instruments': [], 'active_years': '', 'albums': [], 'labels': []}
-            for param in template.params:
-                param_name = str(param.name).strip().lower()
-                param_value = str(param.value).strip()
-                if any((pattern in param_name for pattern in self.genre_patterns)):
-                    data['genres'] = self._parse_list_field(param_value)
-                elif any((pattern in param_name for pattern in self.instrument_patterns)):
-                    data['instruments'] = self._parse_list_field(param_value)
-                elif any((pattern in param_name for pattern in self.years_patterns)):
-                    data['active_years'] = clean_text(param_value)
-                elif any((pattern in param_name for pattern in self.album_patterns)):
-                    albums = self._parse_album_field(param_value)
-                    data['albums'] = [{'title': album} for album in albums]
-                elif any((pattern in param_name for pattern in self.label_patterns)):
-                    data['labels'] = self._parse_list_field(param_value)
-            return data
-        except Exception as e:
-            logger.error(f'Error parsing infobox: {e}')
-            return {}
+            params = [(param.name, param.value, param.value) for param in templates[0].params]
+        data = {'genres': [], 'instruments': [], 'active_years': '', 'albums': [], 'labels': []}
+        for name, value, value_wikicode in params:
+            field = _match_field(str(name))
+            if field is None:
+                continue
+            param_value = str(value).strip()
+            if field == 'active_years':
+                data[field] = clean_text(param_value)
+            elif field == 'albums':
+                data[field] = [{'title': album} for album in _parse_album_field(param_value, value_wikicode)]
+            else:
+                data[field] = _parse_list_field(param_value, value_wikicode)
+        return data
+    except Exception as e:
+        logger.error(f'Error parsing infobox: {e}')
+        return {}
 
-    def _parse_list_field(self, field_value: str) -> List[str]:
-        if not field_value:
-            return []
-        try:
-            wikicode = mwparserfromhell.parse(field_value)
-            templates = wikicode.filter_templates()
-            if templates:
-                items = []
-                for template in templates:
-                    template_name = str(template.name).strip().lower()
-                    if 'flatlist' in template_name or 'flat list' in template_name or 'hlist' in template_name:
-                        for param in template.params:
-                            param_value = str(param.value).strip()
-                            if param_value:
-                                items.append(param_value)
-                        template_str = str(template)
-                        body_match = re.search('\\|\\s*(.*)', template_str, re.DOTALL)
-                        if body_match:
-                            body_content = body_match.group(1)
-                            body_content = re.sub('\\}\\}$', '', body_content)
-                            lines = body_content.split('\n')
-                            for line in lines:
-                                line = line.strip()
-                                if line and (line.startswith('*') or line.startswith('|')):
-                                    item = re.sub('^[\\*\\|\\s]+', '', line)
-                                    if item and item not in items:
-                                        items.append(item)
-                    else:
-                        for param in template.params:
-                            param_value = str(param.value).strip()
-                            if param_value:
-                                items.append(param_value)
-                if items:
-                    field_value = '\n'.join(items)
-        except Exception:
-            pass
-        field_value = re.sub('\\[\\[([^\\]|]+\\|)?([^\\]]+)\\]\\]', '\\2', field_value)
-        field_value = re.sub("'''?([^']+)'''?", '\\1', field_value)
-        field_value = re.sub('<[^>]+>', '', field_value)
-        field_value = re.sub('\\{\\{[^}]+\\}\\}', '', field_value)
-        field_value = re.sub('<ref[^>]*>.*?</ref>', '', field_value, flags=re.DOTALL)
-        field_value = re.sub('^\\s*[{}|]+\\s*', '', field_value)
-        field_value = re.sub('\\s*[{}|]+\\s*$', '', field_value)
-        items = re.split('[,;\\n•|]|<br\\s*/?>', field_value)
-        cleaned_items = []
-        for item in items:
-            item = item.strip()
-            item = re.sub('^[\\*\\s{}\\|]+', '', item)
-            item = re.sub('[\\*\\s{}\\|]+$', '', item)
-            item = re.sub('\\{\\{|\\}\\}', '', item)
-            item = clean_text(item)
-            item = self._normalize_genre(item)
-            if item and len(item) > 1 and (len(item) < 100):
-                artifact_patterns = ['}}', '{{', '|', '*', '']
-                if item not in artifact_patterns:
-                    cleaned_items.append(item)
-        seen = set()
-        unique_items = []
-        for item in cleaned_items:
-            item_lower = item.lower()
-            if item_lower not in seen:
-                seen.add(item_lower)
-                unique_items.append(item)
-        return unique_items[:10]
+def _parse_list_field(field_value: str, wikicode: Optional[Any]=None) -> List[str]:
+    if not field_value:
+        return []
+    field_value = _expand_templates(field_value, wikicode)
+    return _clean_split_dedupe(field_value, _split_list, 10, 100, normalize=_normalize_genre)
 
-    def _normalize_genre(self, genre: str) -> str:
-        if not genre:
-            return ''
-        genre = genre.strip()
-        normalizations = {'r&b': 'R&B', 'r & b': 'R&B', 'r and b': 'R&B', 'nhạc pop': 'pop', 'nhạc rock': 'rock', 'nhạc soul': 'soul', 'nhạc dance': 'dance', 'nhạc hip hop': 'hip hop', 'nhạc rap': 'rap', 'nhạc country': 'country', 'nhạc jazz': 'jazz', 'nhạc blues': 'blues', 'nhạc electronic': 'electronic', 'nhạc folk': 'folk', 'nhạc alternative': 'alternative', 'dance-pop': 'dance pop', 'pop-rock': 'pop rock', 'rock-pop': 'rock pop', 'hip-hop': 'hip hop', 'hip hop': 'hip hop', 'r&b đương đại': 'contemporary R&B', 'r&b contemporary': 'contemporary R&B', 'contemporary r&b': 'contemporary R&B', 'blue-eyed soul': 'blue eyed soul', 'funk-pop': 'funk pop', 'acoustic rock': 'acoustic rock', 'blues rock': 'blues rock', 'pop dân gian': 'folk pop', 'pop folk': 'folk pop'}
-        genre_lower = genre.lower()
-        if genre_lower in normalizations:
-            return normalizations[genre_lower]
-        if genre_lower.startswith('r&b'):
-            return 'R&B' + genre[3:] if len(genre) > 3 else 'R&B'
-        words = genre.split()
-        normalized_words = []
-        for word in words:
-            word_lower = word.lower()
-            if word_lower in ['r&b', 'pop', 'r&b', 'edm', 'idm']:
-                normalized_words.append(word.upper() if word.isupper() else word_lower)
-            else:
-                normalized_words.append(word.capitalize())
-        return ' '.join(normalized_words)
+def _expand_templates(field_value: str, wikicode: Optional[Any]=None) -> str:
+    if '{{' not in field_value:
+        return field_value
+    try:
+        if wikicode is None:
+            wikicode = _WIKITEXT_PARSER.parse(field_value)
+        templates = wikicode.filter_templates()
+        if templates:
+            items = []
+            for template in templates:
+                for param in template.params:
+                    param_value = str(param.value).strip()
+                    if param_value:
+                        items.append(param_value)
+            if items:
+                field_value = '\n'.join(items)
+    except Exception:
+        pass
+    return field_value
 
-    def _parse_album_field(self, field_value: str) -> List[str]:
-        if not field_value:
-            return []
-        try:
-            wikicode = mwparserfromhell.parse(field_value)
-            templates = wikicode.filter_templates()
-            if templates:
-                items = []
-                for template in templates:
-                    template_name = str(template.name).strip().lower()
-                    if 'flatlist' in template_name or 'flat list' in template_name or 'hlist' in template_name:
-                        for param in template.params:
-                            param_value = str(param.value).strip()
-                            if param_value:
-                                items.append(param_value)
-                        template_str = str(template)
-                        body_match = re.search('\\|\\s*(.*)', template_str, re.DOTALL)
-                        if body_match:
-                            body_content = body_match.group(1)
-                            body_content = re.sub('\\}\\}$', '', body_content)
-                            lines = body_content.split('\n')
-                            for line in lines:
-                                line = line.strip()
-                                if line and (line.startswith('*') or line.startswith('|')):
-                                    item = re.sub('^[\\*\\|\\s]+', '', line)
-                                    if item and item not in items:
-                                        items.append(item)
-                    else:
-                        for param in template.params:
-                            param_value = str(param.value).strip()
-                            if param_value:
-                                items.append(param_value)
-                if items:
-                    field_value = '\n'.join(items)
-        except Exception:
-            pass
-        field_value = re.sub('\\[\\[([^\\]|]+\\|)?([^\\]]+)\\]\\]', '\\2', field_value)
-        field_value = re.sub("'''?([^']+)'''?", '\\1', field_value)
-        field_value = re.sub('<[^>]+>', '', field_value)
-        field_value = re.sub('\\{\\{[^}]+\\}\\}', '', field_value)
-        field_value = re.sub('<ref[^>]*>.*?</ref>', '', field_value, flags=re.DOTALL)
-        field_value = re.sub('^\\s*[{}|]+\\s*', '', field_value)
-        field_value = re.sub('\\s*[{}|]+\\s*$', '', field_value)
-        items = re.split('[,;\\n•|]|<br\\s*/?>|\\s*–\\s*|\\s*—\\s*|\\s*-\\s*(?=[A-ZĂÂÊÔƠƯĐ])', field_value)
-        cleaned_items = []
-        for item in items:
-            item = item.strip()
-            item = re.sub('^[\\*\\s{}\\|]+', '', item)
-            item = re.sub('[\\*\\s{}\\|]+$', '', item)
-            item = re.sub('\\{\\{|\\}\\}', '', item)
-            item = re.sub('\\s*\\(\\d{4}\\)\\s*$', '', item)
-            item = clean_text(item)
-            if item and len(item) > 1 and (len(item) < 200):
-                artifact_patterns = ['}}', '{{', '|', '*', '']
-                if item not in artifact_patterns:
-                    cleaned_items.append(item)
-        seen = set()
-        unique_items = []
-        for item in cleaned_items:
-            item_lower = item.lower()
-            if item_lower not in seen:
-                seen.add(item_lower)
-                unique_items.append(item)
-        return unique_items[:30]
+@lru_cache(maxsize=16384)
+def _clean_item(item: str, normalize: Optional[Callable[[str], str]], strip_year: bool) -> Tuple[str, str]:
+    item = item.strip(_ITEM_STRIP_CHARS).replace('{{', '').replace('}}', '')
+    if strip_year:
+        item = _RE_TRAILING_YEAR.sub('', item)
+    item = clean_text(item)
+    if normalize is not None:
+        item = normalize(item)
+    return (item, item.lower())
+
+def _clean_split_dedupe(field_value: str, splitter: Callable[[str], List[str]], max_items: int, max_length: int, normalize: Optional[Callable[[str], str]]=None, strip_year: bool=False) -> List[str]:
+    if not _MARKUP_CHARS.isdisjoint(field_value):
+        field_value = _RE_CLEANUP.sub(_cleanup_replace, field_value)
+    field_value = field_value.strip('{}| \t\n')
+    unique_items = {}
+    for item in splitter(field_value):
+        item, item_lower = _clean_item(item, normalize, strip_year)
+        if 1 < len(item) < max_length:
+            unique_items.setdefault(item_lower, item)
+            if len(unique_items) == max_items:
+                break
+    return list(unique_items.values())
+
+@lru_cache(maxsize=4096)
+def _normalize_genre(genre: str) -> str:
+    if not genre:
+        return ''
+    genre = genre.strip()
+    genre_lower = genre.lower()
+    if genre_lower in _GENRE_NORMALIZATIONS:
+        return _GENRE_NORMALIZATIONS[genre_lower]
+    if genre_lower.startswith('r&b'):
+        return 'R&B' + genre[3:] if len(genre) > 3 else 'R&B'
+    words = genre.split()
+    normalized_words = []
+    for word in words:
+        word_lower = word.lower()
+        if word_lower in _LOWERCASE_GENRE_WORDS:
+            normalized_words.append(word.upper() if word.isupper() else word_lower)
+        else:
+            normalized_words.append(word.capitalize())
+    return ' '.join(normalized_words)
+
+def _parse_album_field(field_value: str, wikicode: Optional[Any]=None) -> List[str]:
+    if not field_value:
+        return []
+    field_value = _expand_templates(field_value, wikicode)
+    return _clean_split_dedupe(field_value, _RE_ALBUM_TOKEN.findall, 30, 200, strip_year=True)
 
-    def _validate_album_name(self, album_name: str) -> bool:
-        if not album_name:
-            return False
-        album_name = album_name.strip()
-        if len(album_name) <= 1:
-            return False
-        if len(album_name) < 4:
-            return False
-        if len(album_name) > 200:
-            return False
-        if album_name.isdigit():
-            return False
-        if re.match('^\\(\\d{4}\\)$', album_name):
-            return False
-        false_positives = ['yes', 'no', 'all', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten', 'ref', 'web', 'review', 'citation', 'billboard', 'magic', 'week', 'list', 'index', 'title', 'name', 'album', 'song']
-        if album_name.lower() in false_positives:
-            return False
-        if album_name[0] in ['(', '[', '{', '/', '\\', '-', '_', '|', '*']:
-            return False
-        if album_name[-1] in ['(', '[', '{', '/', '\\', '|', '*']:
-            return False
-        if '}}' in album_name or '{{' in album_name or '</ref>' in album_name:
-            return False
-        vietnamese_bad_patterns = ['^đầu tay\\s', '^tư\\s', '^ng\\s', '^của\\s', '^được\\s', '^là\\s', '^có\\s', '^trong\\s', '^với\\s', '^theo\\s', '^từ\\s', 'nh tên', 'a cô', 'ng tên', 'tên cô', '^\\s*album\\s+của\\s', '^\\s*đĩa nhạc\\s+của\\s']
-        for pattern in vietnamese_bad_patterns:
-            if re.search(pattern, album_name, re.IGNORECASE):
-                return False
-        incomplete_patterns = ['^to\\s[A-Z][a-z]+$', '^a\\s[A-Z][a-z]+$', '^an\\s[A-Z][a-z]+$', '^the\\s[A-Z][a-z]+$', '^by\\s[A-Z]', '^of\\s[A-Z]', '^from\\s[A-Z]', '^with\\s[A-Z]', '^album\\s+by\\s', '^album\\s+of\\s', '^song\\s+by\\s', '^single\\s+by\\s']
-        for pattern in incomplete_patterns:
-            if re.match(pattern, album_name, re.IGNORECASE):
-                return False
-        generic_words = ['book', 'chapter', 'part', 'section', 'volume', 'edition', 'version', 'demo', 'remix', 'edit', 'mix', 'cut', 'single', 'album', 'ep', 'lp', 'cd', 'tape', 'record']
-        words = album_name.lower().split()
-        if len(words) == 1 and words[0] in generic_words:
-            return False
-        if len(words) == 1 and len(album_name) < 8:
-            return False
-        overly_common = ['celebration', 'greatest hits', 'best of', 'collection', 'anthology', 'greatest hits album', 'best of album']
-        if album_name.lower() in overly_common:
-            return False
-        if re.search('\\s+\\(album\\s+(của|by|of)', album_name, re.IGNORECASE):
-            return False
-        only_common_words = ['the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for']
-        if len(words) <= 2 and all((word.lower() in only_common_words for word in words)):
-            return False
+def _quick_reject(album_name: str) -> bool:
+    if len(album_name) < 4 or len(album_name) > 200:
         return True
+    if album_name.isdigit():
+        return True
+    if album_name[0] in _BAD_FIRST_CHARS or album_name[-1] in _BAD_LAST_CHARS:
+        return True
+    if '}}' in album_name or '{{' in album_name or '</ref>' in album_name:
+        return True
+    album_lower = album_name.lower()
+    if album_lower in _FALSE_POSITIVES or album_lower in _OVERLY_COMMON:
+        return True
+    words = album_lower.split()
+    if len(words) == 1 and (len(album_name) < 8 or words[0] in _GENERIC_WORDS):
+        return True
+    return len(words) <= 2 and all((word in _ONLY_COMMON for word in words))
 
-    def parse_artist(self, artist_data: Dict) -> Dict[str, Any]:
-        infobox_text = artist_data.get('infobox', '')
-        parsed_infobox = self.parse_infobox(infobox_text)
-        raw_albums = artist_data.get('albums', [])
-        infobox_albums = parsed_infobox.get('albums', [])
-        all_albums = []
-        album_titles = set()
-        for album in raw_albums:
-            if isinstance(album, str):
-                album_title = album.strip()
-            elif isinstance(album, dict):
-                album_title = album.get('title', '').strip()
-            else:
-                continue
-            if album_title and self._validate_album_name(album_title):
-                album_title_lower = album_title.lower()
-                if album_title_lower not in album_titles:
-                    album_titles.add(album_title_lower)
-                    all_albums.append({'title': album_title})
-        for album in infobox_albums:
-            if isinstance(album, dict):
-                album_title = album.get('title', '').strip()
-            elif isinstance(album, str):
-                album_title = album.strip()
-            else:
-                continue
-            if album_title and self._validate_album_name(album_title):
-                album_title_lower = album_title.lower()
-                if album_title_lower not in album_titles:
-                    album_titles.add(album_title_lower)
-                    all_albums.append({'title': album_title})
-        return {'name': artist_data.get('title', ''), 'url': artist_data.get('url', ''), 'summary': artist_data.get('summary', ''), 'genres': parsed_infobox.get('genres', []), 'instruments': parsed_infobox.get('instruments', []), 'active_years': parsed_infobox.get('active_years', ''), 'albums': all_albums, 'labels': parsed_infobox.get('labels', [])}
+def _validate_album_name(album_name: str) -> bool:
+    if not album_name:
+        return False
+    album_name = album_name.strip()
+    if _quick_reject(album_name):
+        return False
+    return not _RE_BAD_ALBUM.search(album_name)
 
-    def parse_all(self, input_path: str='data/raw/artists.json') -> List[Dict]:
+def parse_artist(artist_data: Dict) -> Dict[str, Any]:
+    infobox_text = artist_data.get('infobox', '')
+    parsed_infobox = parse_infobox(infobox_text)
+    raw_albums = artist_data.get('albums', [])
+    infobox_albums = parsed_infobox.get('albums', [])
+    album_titles = {}
+    for album in itertools.chain(raw_albums, infobox_albums):
+        if isinstance(album, str):
+            album_title = album.strip()
+        elif isinstance(album, dict):
+            album_title = album.get('title', '').strip()
+        else:
+            continue
+        if not album_title:
+            continue
+        album_title_lower = album_title.lower()
+        if album_title_lower in album_titles or not _validate_album_name(album_title):
+            continue
+        album_titles[album_title_lower] = album_title
+    all_albums = [{'title': album_title} for album_title in album_titles.values()]
+    return {'name': artist_data.get('title', ''), 'url': artist_data.get('url', ''), 'summary': artist_data.get('summary', ''), 'genres': parsed_infobox.get('genres', []), 'instruments': parsed_infobox.get('instruments', []), 'active_years': parsed_infobox.get('active_years', ''), 'albums': all_albums, 'labels': parsed_infobox.get('labels', [])}
+
+class InfoboxParser:
+
+    def __init__(self):
+        self.genre_patterns = _GENRE_PATTERNS
+        self.instrument_patterns = _INSTRUMENT_PATTERNS
+        self.years_patterns = _YEARS_PATTERNS
+        self.album_patterns = _ALBUM_PATTERNS
+        self.label_patterns = _LABEL_PATTERNS
+    _match_field = staticmethod(_match_field)
+    parse_infobox = staticmethod(parse_infobox)
+    _parse_list_field = staticmethod(_parse_list_field)
+    _expand_templates = staticmethod(_expand_templates)
+    _clean_split_dedupe = staticmethod(_clean_split_dedupe)
+    _normalize_genre = staticmethod(_normalize_genre)
+    _parse_album_field = staticmethod(_parse_album_field)
+    _validate_album_name = staticmethod(_validate_album_name)
+    parse_artist = staticmethod(parse_artist)
+
+    def iter_parse_all(self, input_path: str='data/raw/artists.json', processes: Optional[int]=None) -> Iterator[Dict]:
         logger.info(f'Parsing artists from {input_path}...')
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                artists = json.load(f)
-            parsed_artists = []
-            for i, artist in enumerate(artists, 1):
-                try:
-                    parsed = self.parse_artist(artist)
-                    parsed_artists.append(parsed)
+            parsed_count = 0
+            with multiprocessing.Pool(processes=processes) as pool:
+                for i, parsed in enumerate(pool.imap(_parse_one, _iter_artists(input_path), chunksize=64), 1):
+                    if parsed is not None:
+                        for field in _INTERNED_FIELDS:
+                            parsed[field] = [sys.intern(item) for item in parsed[field]]
+                        parsed_count += 1
+                        yield parsed
                     if i % 100 == 0:
-                        logger.info(f'Parsed {i}/{len(artists)} artists')
-                except Exception as e:
-                    logger.error(f'Error parsing artist {artist.get('title', 'unknown')}: {e}')
-            logger.info(f'Successfully parsed {len(parsed_artists)} artists')
-            return parsed_artists
+                        logger.info(f'Parsed {i} artists')
+            logger.info(f'Successfully parsed {parsed_count} artists')
         except Exception as e:
             logger.error(f'Error loading artists from {input_path}: {e}')
-            return []
 
-def parse_all(input_path: str='data/raw/artists.json', output_path: str='data/processed/parsed_artists.json') -> int:
+    def parse_all(self, input_path: str='data/raw/artists.json', processes: Optional[int]=None) -> List[Dict]:
+        return list(self.iter_parse_all(input_path, processes=processes))
+
+def _parse_one(artist: Dict) -> Optional[Dict]:
+    try:
+        return parse_artist(artist)
+    except Exception as e:
+        title = artist.get('title', 'unknown')
+        logger.error(f'Error parsing artist {title}: {e}')
+        return None
+
+def _dumps_indented(item: Dict) -> bytes:
+    return orjson.dumps(item, option=orjson.OPT_INDENT_2)
+
+def _write_json_array(items: Iterable[Dict], f: BinaryIO) -> int:
+    count = 0
+    for item in items:
+        f.write(b',\n  ' if count else b'[\n  ')
+        f.write(_dumps_indented(item).replace(b'\n', b'\n  '))
+        count += 1
+    f.write(b'\n]' if count else b'[]')
+    return count
+
+def parse_all(input_path: str='data/raw/artists.json', output_path: str='data/processed/parsed_artists.json', processes: Optional[int]=None) -> int:
     import os
     parser = InfoboxParser()
-    parsed_artists = parser.parse_all(input_path)
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(parsed_artists, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        parsed_count = _write_json_array(parser.iter_parse_all(input_path, processes=processes), f)
     logger.info(f'Saved parsed data to {output_path}')
-    return len(parsed_artists)
+    return parsed_count
 if __name__ == '__main__':
     parse_all()
@@ -1,26 +1,165 @@
+import itertools
 import json
 import os
-from typing import Dict, List, Tuple, Optional
+import pickle
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Optional
+import numpy as np
 import pandas as pd
 import networkx as nx
+from scipy import sparse
+import orjson
 from data_collection.utils import logger, clean_text
 
+_CATEGORY_CLEANUP = ((re.compile('\\[\\[([^\\]|]+\\|)?([^\\]]+)\\]\\]'), '\\2'), (re.compile('\\|.*$'), ''), (re.compile('\\[\\[|\\]\\]'), ''), (re.compile("'''?"), ''), (re.compile('rowspan\\s*=\\s*["\\\']?\\d+["\\\']?', re.IGNORECASE), ''), (re.compile('colspan\\s*=\\s*["\\\']?\\d+["\\\']?', re.IGNORECASE), ''), (re.compile('style\\s*=\\s*["\\\'][^"\\\']*["\\\']', re.IGNORECASE), ''), (re.compile('class\\s*=\\s*["\\\'][^"\\\']*["\\\']', re.IGNORECASE), ''))
+_VIETNAMESE_CATEGORIES = (('album của năm', 'Album of the Year'), ('bài hát của năm', 'Song of the Year'), ('nghệ sĩ của năm', 'Artist of the Year'), ('thu âm của năm', 'Record of the Year'), ('video của năm', 'Video of the Year'), ('album giọng pop xuất sắc nhất', 'Best Pop Vocal Album'), ('trình diễn solo giọng pop xuất sắc nhất', 'Best Pop Solo Performance'), ('nghệ sĩ mới xuất sắc nhất', 'Best New Artist'), ('best pop video', 'Best Pop Video'), ('best pop', 'Best Pop'))
+_CATEGORY_PATTERNS = tuple(((re.compile(pattern), normalized) for pattern, normalized in (('best\\s+album.*', 'Best Album'), ('best\\s+song.*', 'Best Song'), ('best\\s+artist.*', 'Best Artist'), ('best\\s+record.*', 'Best Record'), ('best\\s+video.*', 'Best Video'), ('best\\s+performance.*', 'Best Performance'), ('best\\s+new\\s+artist.*', 'Best New Artist'), ('album\\s+of\\s+the\\s+year', 'Album of the Year'), ('song\\s+of\\s+the\\s+year', 'Song of the Year'), ('artist\\s+of\\s+the\\s+year', 'Artist of the Year'), ('record\\s+of\\s+the\\s+year', 'Record of the Year'), ('video\\s+of\\s+the\\s+year', 'Video of the Year'), ('best\\s+pop\\s+video', 'Best Pop Video'), ('best\\s+pop\\s+vocal\\s+album', 'Best Pop Vocal Album'), ('best\\s+pop\\s+solo\\s+performance', 'Best Pop Solo Performance'))))
+_ENGLISH_PATTERNS = tuple((re.compile(pattern) for pattern in ('best\\s+(?:pop\\s+)?video', 'best\\s+(?:pop\\s+)?(?:vocal\\s+)?album', 'best\\s+(?:pop\\s+)?(?:solo\\s+)?performance', 'best\\s+new\\s+artist', 'album\\s+of\\s+the\\s+year', 'song\\s+of\\s+the\\s+year', 'record\\s+of\\s+the\\s+year')))
+
+_PART_OF_EDGE = {'relationship': 'PART_OF'}
+_HAS_GENRE_EDGE = {'relationship': 'HAS_GENRE'}
+_SIGNED_WITH_EDGE = {'relationship': 'SIGNED_WITH'}
+_PERFORMS_ON_EDGE = {'relationship': 'PERFORMS_ON'}
+_CSV_COLUMNS = {'nodes': frozenset(('id', 'name', 'genres', 'instruments', 'active_years', 'url', 'labels')), 'genres': frozenset(('id', 'name', 'normalized_name', 'count')), 'songs': frozenset(('id', 'title', 'duration', 'track_number', 'album_id', 'featured_artists')), 'awards': frozenset(('id', 'name', 'ceremony', 'category', 'year'))}
+_EXPORT_FIELDS = {'Artist': (('name', ''), ('genres', ''), ('instruments', ''), ('active_years', ''), ('url', '')), 'Album': (('title', ''),), 'Genre': (('name', ''), ('normalized_name', ''), ('count', 0)), 'Band': (('name', ''), ('url', ''), ('classification_confidence', 0.0)), 'RecordLabel': (('name', ''),), 'Song': (('title', ''), ('duration', ''), ('track_number', ''), ('album_id', ''), ('featured_artists', '')), 'Award': (('name', ''), ('ceremony', ''), ('category', ''), ('year', ''))}
+_EXPORT_WORKERS = 4
+
+def _read_csv(path: str, kind: str) -> pd.DataFrame:
+    columns = _CSV_COLUMNS[kind]
+    return pd.read_csv(path, encoding='utf-8', usecols=lambda column: column in columns)
+
+def _pair_key(pair: Tuple[str, str]) -> Tuple[str, str]:
+    return pair if pair[0] <= pair[1] else (pair[1], pair[0])
+
+def _explode_labels(df: pd.DataFrame) -> pd.DataFrame:
+    labels = df['labels'].reset_index(drop=True).dropna()
+    labels = labels[labels.astype(bool)].astype(str).str.split(';').explode().str.strip()
+    labels = labels[labels != '']
+    return pd.DataFrame({'id': df['id'].to_numpy()[labels.index.to_numpy()], 'label': labels.to_numpy()})
+
+def _load_json(path: str) -> Any:
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+@lru_cache(maxsize=4096)
+def _parse_track_number(track_number: Any) -> Any:
+    if not track_number or pd.isna(track_number):
+        return None
+    track_str = str(track_number).strip()
+    if not track_str:
+        return None
+    try:
+        return int(float(track_str))
+    except (ValueError, TypeError):
+        return track_str
+
+_CEREMONY_NORMALIZATIONS = {'grammy awards': 'Grammy', 'billboard music awards': 'Billboard', 'mtv video music awards': 'MTV', 'brit awards': 'Brit', 'american music awards': 'AMA'}
+
+@lru_cache(maxsize=4096)
+def _normalize_award_name(ceremony: str) -> str:
+    if not ceremony:
+        return ''
+    ceremony_lower = ceremony.lower().strip()
+    return _CEREMONY_NORMALIZATIONS.get(ceremony_lower, ceremony)
+
+@lru_cache(maxsize=4096)
+def _normalize_award_category(category: str) -> str:
+    if not category:
+        return 'General'
+    for pattern, replacement in _CATEGORY_CLEANUP:
+        category = pattern.sub(replacement, category)
+    category = clean_text(category)
+    if not category or len(category.strip()) < 3 or category.lower().strip() in ['rowspan', 'colspan']:
+        return 'General'
+    category_lower = category.lower().strip()
+    for vi_cat, en_cat in _VIETNAMESE_CATEGORIES:
+        if vi_cat in category_lower:
+            return en_cat
+    for pattern, normalized in _CATEGORY_PATTERNS:
+        if pattern.search(category_lower):
+            return normalized
+    for pattern in _ENGLISH_PATTERNS:
+        match = pattern.search(category_lower)
+        if match:
+            matched = match.group(0)
+            for p, norm in _CATEGORY_PATTERNS:
+                if p.search(matched):
+                    return norm
+    if category and category[0].islower():
+        category = category[0].upper() + category[1:]
+    return category if category else 'General'
+
+def _norm_year(year: Any) -> Optional[int]:
+    if year is None or year == '' or year != year:
+        return None
+    if isinstance(year, int):
+        return year
+    try:
+        if isinstance(year, float):
+            return int(year)
+        return int(str(year).strip())
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+def _award_key(ceremony, category, year) -> Optional[Tuple]:
+    ceremony = str(ceremony).strip()
+    category = str(category).strip()
+    if ceremony and category:
+        return (ceremony, category, _norm_year(year))
+    return None
+
 class GraphBuilder:
 
-    def __init__(self):
+    def __init__(self, csv_chunksize: int=100000):
         self.graph = nx.Graph()
         self.artist_nodes = {}
-        self.album_nodes = {}
         self.album_id_to_artists = {}
-        self.genre_nodes = {}
-        self.band_nodes = {}
-        self.record_label_nodes = {}
         self.song_nodes = {}
         self.award_nodes = {}
+        self._name_index = None
+        self._award_key_to_id = {}
+        self._nodes_by_type = defaultdict(dict)
+        self.csv_chunksize = csv_chunksize
+
+    @property
+    def album_nodes(self) -> Dict[str, str]:
+        return {node_data['title']: album_id for album_id, node_data in self._nodes_by_type['Album'].items()}
+
+    @property
+    def genre_nodes(self) -> Dict:
+        return {genre_id: genre_id for genre_id in self._nodes_by_type['Genre']}
+
+    @property
+    def band_nodes(self) -> Dict[str, str]:
+        return {node_data['name']: band_id for band_id, node_data in self._nodes_by_type['Band'].items()}
+
+    @property
+    def record_label_nodes(self) -> Dict[str, str]:
+        return {node_data['name']: label_id for label_id, node_data in self._nodes_by_type['RecordLabel'].items()}
+
+    def _index_nodes(self, node_type: str, node_ids: Iterable[str]):
+        nodes = self._nodes_by_type[node_type]
+        for node_id in node_ids:
+            nodes[node_id] = self.graph.nodes[node_id]
+
+    def rebuild_indexes(self):
+        self._nodes_by_type = defaultdict(dict)
+        for node_id, node_data in self.graph.nodes(data=True):
+            self._nodes_by_type[node_data.get('node_type')][node_id] = node_data
+        self._award_key_to_id = {}
+        self._index_award_keys(self._nodes_by_type['Award'].items())
+        self._name_index = None
 
     def load_nodes(self, nodes_path: str) -> pd.DataFrame:
         try:
-            df = pd.read_csv(nodes_path, encoding='utf-8')
+            df = _read_csv(nodes_path, 'nodes')
             logger.info(f'Loaded {len(df)} artist nodes from {nodes_path}')
             return df
         except Exception as e:
@@ -29,8 +168,7 @@ class GraphBuilder:
 
     def load_albums(self, albums_path: str) -> Dict:
         try:
-            with open(albums_path, 'r', encoding='utf-8') as f:
-                albums = json.load(f)
+            albums = _load_json(albums_path)
             logger.info(f'Loaded {len(albums)} albums from {albums_path}')
             return albums
         except Exception as e:
@@ -39,7 +177,7 @@ class GraphBuilder:
 
     def load_genres(self, genres_path: str) -> pd.DataFrame:
         try:
-            df = pd.read_csv(genres_path, encoding='utf-8')
+            df = _read_csv(genres_path, 'genres')
             logger.info(f'Loaded {len(df)} genre nodes from {genres_path}')
             return df
         except Exception as e:
@@ -48,8 +186,7 @@ class GraphBuilder:
 
     def load_band_classifications(self, classifications_path: str) -> List[Dict]:
         try:
-            with open(classifications_path, 'r', encoding='utf-8') as f:
-                classifications = json.load(f)
+            classifications = _load_json(classifications_path)
             logger.info(f'Loaded {len(classifications)} band classifications from {classifications_path}')
             return classifications
         except Exception as e:
@@ -58,7 +195,7 @@ class GraphBuilder:
 
     def load_songs(self, songs_path: str) -> pd.DataFrame:
         try:
-            df = pd.read_csv(songs_path, encoding='utf-8')
+            df = _read_csv(songs_path, 'songs')
             logger.info(f'Loaded {len(df)} song nodes from {songs_path}')
             return df
         except Exception as e:
@@ -67,7 +204,7 @@ class GraphBuilder:
 
     def load_awards(self, awards_path: str) -> pd.DataFrame:
         try:
-            df = pd.read_csv(awards_path, encoding='utf-8')
+            df = _read_csv(awards_path, 'awards')
             logger.info(f'Loaded {len(df)} award nodes from {awards_path}')
             return df
         except Exception as e:
@@ -78,20 +215,27 @@ class GraphBuilder:
         if df.empty:
             logger.warning('No awards to add')
             return
-        awards_added = 0
-        for idx, row in df.iterrows():
-            award_id = f'award_{row['id']}'
-            self.award_nodes[row['id']] = award_id
-            self.graph.add_node(award_id, node_type='Award', name=row.get('name', ''), ceremony=row.get('ceremony', ''), category=row.get('category', ''), year=row.get('year', ''))
-            awards_added += 1
+        award_nodes = []
+        for award_row_id, name, ceremony, category, year in df.reindex(columns=['id', 'name', 'ceremony', 'category', 'year'], fill_value='').itertuples(index=False, name=None):
+            award_id = f'award_{award_row_id}'
+            self.award_nodes[award_row_id] = award_id
+            award_nodes.append((award_id, {'node_type': 'Award', 'name': name, 'ceremony': ceremony, 'category': category, 'year': year}))
+        self.graph.add_nodes_from(award_nodes)
+        self._index_award_keys(award_nodes)
+        self._index_nodes('Award', (award_id for award_id, _ in award_nodes))
+        awards_added = len(award_nodes)
         logger.info(f'Added {awards_added} award nodes to graph')
 
+    def _index_award_keys(self, award_nodes: Iterable[Tuple[str, Dict]]):
+        for award_id, node_data in award_nodes:
+            award_key = _award_key(node_data.get('ceremony', ''), node_data.get('category', ''), node_data.get('year'))
+            if award_key:
+                self._award_key_to_id[award_key] = award_id
+
     def add_award_nomination_relationships(self, awards_json_path: str, awards_csv_path: str=None):
-        import json
         logger.info(f'Loading awards data from {awards_json_path}...')
         try:
-            with open(awards_json_path, 'r', encoding='utf-8') as f:
-                awards_data = json.load(f)
+            awards_data = _load_json(awards_json_path)
             logger.info(f'Loaded awards data for {len(awards_data)} artists')
         except Exception as e:
             logger.error(f'Error loading awards JSON file: {e}')
@@ -99,115 +243,44 @@ class GraphBuilder:
         if not awards_data:
             logger.warning('No awards data found')
             return
-        award_key_to_id = {}
-        if awards_csv_path and os.path.exists(awards_csv_path):
+        award_key_to_id = self._award_key_to_id
+        if not award_key_to_id:
+            self._index_award_keys(self._nodes_by_type['Award'].items())
+        if award_key_to_id:
+            logger.info(f'Using mapping for {len(award_key_to_id)} awards from graph')
+        elif awards_csv_path and os.path.exists(awards_csv_path):
+            award_key_to_id = {}
             awards_df = self.load_awards(awards_csv_path)
             if not awards_df.empty:
-                for idx, row in awards_df.iterrows():
-                    ceremony = str(row.get('ceremony', '')).strip()
-                    category = str(row.get('category', '')).strip()
-                    year = row.get('year')
-                    if year == '' or pd.isna(year):
-                        year = None
-                    elif isinstance(year, str) and year.strip():
-                        try:
-                            year = int(year.strip())
-                        except (ValueError, TypeError):
-                            year = None
-                    if ceremony and category:
-                        award_key = (ceremony, category, year)
-                        award_id = f'award_{row['id']}'
-                        award_key_to_id[award_key] = award_id
+                years = awards_df['year'] if 'year' in awards_df.columns else itertools.repeat(None)
+                for award_id, (ceremony, category), year in zip(awards_df['id'], awards_df.reindex(columns=['ceremony', 'category'], fill_value='').itertuples(index=False, name=None), years):
+                    award_key = _award_key(ceremony, category, year)
+                    if award_key:
+                        award_key_to_id[award_key] = f'award_{award_id}'
                 logger.info(f'Created mapping for {len(award_key_to_id)} awards from CSV')
-        else:
-            for node_id in self.graph.nodes():
-                node_data = self.graph.nodes[node_id]
-                if node_data.get('node_type') == 'Award':
-                    ceremony = str(node_data.get('ceremony', '')).strip()
-                    category = str(node_data.get('category', '')).strip()
-                    year = node_data.get('year')
-                    if year == '' or pd.isna(year):
-                        year = None
-                    if ceremony and category:
-                        award_key = (ceremony, category, year)
-                        award_key_to_id[award_key] = node_id
-            logger.info(f'Created mapping for {len(award_key_to_id)} awards from graph')
         if not award_key_to_id:
             logger.warning('No award nodes found. Call add_award_nodes() first or provide awards_csv_path.')
             return
 
-        def normalize_award_name(ceremony: str) -> str:
-            if not ceremony:
-                return ''
-            normalization_map = {'grammy awards': 'Grammy', 'billboard music awards': 'Billboard', 'mtv video music awards': 'MTV', 'brit awards': 'Brit', 'american music awards': 'AMA'}
-            ceremony_lower = ceremony.lower().strip()
-            return normalization_map.get(ceremony_lower, ceremony)
-
-        def normalize_award_category(category: str) -> str:
-            if not category:
-                return 'General'
-            import re
-            category = re.sub('\\[\\[([^\\]|]+\\|)?([^\\]]+)\\]\\]', '\\2', category)
-            category = re.sub('\\|.*$', '', category)
-            category = re.sub('\\[\\[|\\]\\]', '', category)
-            category = re.sub("'''?", '', category)
-            category = re.sub('rowspan\\s*=\\s*["\\\']?\\d+["\\\']?', '', category, flags=re.IGNORECASE)
-            category = re.sub('colspan\\s*=\\s*["\\\']?\\d+["\\\']?', '', category, flags=re.IGNORECASE)
-            category = re.sub('style\\s*=\\s*["\\\'][^"\\\']*["\\\']', '', category, flags=re.IGNORECASE)
-            category = re.sub('class\\s*=\\s*["\\\'][^"\\\']*["\\\']', '', category, flags=re.IGNORECASE)
-            category = clean_text(category)
-            if not category or len(category.strip()) < 3 or category.lower().strip() in ['rowspan', 'colspan']:
-                return 'General'
-            vietnamese_to_english = {'album của năm': 'Album of the Year', 'bài hát của năm': 'Song of the Year', 'nghệ sĩ của năm': 'Artist of the Year', 'thu âm của năm': 'Record of the Year', 'video của năm': 'Video of the Year', 'album giọng pop xuất sắc nhất': 'Best Pop Vocal Album', 'trình diễn solo giọng pop xuất sắc nhất': 'Best Pop Solo Performance', 'nghệ sĩ mới xuất sắc nhất': 'Best New Artist', 'best pop video': 'Best Pop Video', 'best pop': 'Best Pop'}
-            category_lower = category.lower().strip()
-            for vi_cat, en_cat in vietnamese_to_english.items():
-                if vi_cat in category_lower:
-                    return en_cat
-            category_patterns = {'best\\s+album.*': 'Best Album', 'best\\s+song.*': 'Best Song', 'best\\s+artist.*': 'Best Artist', 'best\\s+record.*': 'Best Record', 'best\\s+video.*': 'Best Video', 'best\\s+performance.*': 'Best Performance', 'best\\s+new\\s+artist.*': 'Best New Artist', 'album\\s+of\\s+the\\s+year': 'Album of the Year', 'song\\s+of\\s+the\\s+year': 'Song of the Year', 'artist\\s+of\\s+the\\s+year': 'Artist of the Year', 'record\\s+of\\s+the\\s+year': 'Record of the Year', 'video\\s+of\\s+the\\s+year': 'Video of the Year', 'best\\s+pop\\s+video': 'Best Pop Video', 'best\\s+pop\\s+vocal\\s+album': 'Best Pop Vocal Album', 'best\\s+pop\\s+solo\\s+performance': 'Best Pop Solo Performance'}
-            for pattern, normalized in category_patterns.items():
-                if re.search(pattern, category_lower):
-                    return normalized
-            english_patterns = ['best\\s+(?:pop\\s+)?video', 'best\\s+(?:pop\\s+)?(?:vocal\\s+)?album', 'best\\s+(?:pop\\s+)?(?:solo\\s+)?performance', 'best\\s+new\\s+artist', 'album\\s+of\\s+the\\s+year', 'song\\s+of\\s+the\\s+year', 'record\\s+of\\s+the\\s+year']
-            for pattern in english_patterns:
-                match = re.search(pattern, category_lower)
-                if match:
-                    matched = match.group(0)
-                    for p, norm in category_patterns.items():
-                        if re.search(p, matched):
-                            return norm
-            if category and category[0].islower():
-                category = category[0].upper() + category[1:]
-            return category if category else 'General'
         edges_added = 0
         edges_skipped = 0
         artists_not_found = 0
         awards_not_found = 0
+        pending_edges = {}
+        get_edge_data = self.graph.get_edge_data
         for artist_name, awards in awards_data.items():
             artist_node_id = self._find_artist_by_name(artist_name)
             if not artist_node_id:
                 artists_not_found += 1
-                logger.debug(f'Artist/Band not found: {artist_name}')
-                continue
-            if artist_node_id not in self.graph.nodes:
-                artists_not_found += 1
-                logger.debug(f'Artist node not in graph: {artist_node_id}')
+                logger.debug('Artist/Band not found: %s', artist_name)
                 continue
             for award in awards:
-                ceremony = normalize_award_name(award.get('ceremony', ''))
-                category = normalize_award_category(award.get('category', ''))
-                year = award.get('year')
-                if year is None or year == '':
-                    year = None
-                elif isinstance(year, str):
-                    try:
-                        year = int(year.strip())
-                    except (ValueError, TypeError):
-                        year = None
-                elif isinstance(year, (int, float)):
-                    year = int(year)
+                ceremony = _normalize_award_name(award.get('ceremony', ''))
+                category = _normalize_award_category(award.get('category', ''))
+                year = _norm_year(award.get('year'))
                 if not ceremony or not category:
                     edges_skipped += 1
-                    logger.debug(f'Award missing required fields: {award}')
+                    logger.debug('Award missing required fields: %s', award)
                     continue
                 award_key = (ceremony, category, year)
                 award_node_id = award_key_to_id.get(award_key)
@@ -216,23 +289,26 @@ class GraphBuilder:
                     award_node_id = award_key_to_id.get(award_key_no_year)
                 if not award_node_id:
                     awards_not_found += 1
-                    logger.debug(f'Award node not found: {ceremony} - {category} ({year})')
+                    logger.debug('Award node not found: %s - %s (%s)', ceremony, category, year)
                     continue
-                if award_node_id not in self.graph.nodes:
+                if award_node_id not in self.graph:
                     awards_not_found += 1
-                    logger.debug(f'Award node not in graph: {award_node_id}')
+                    logger.debug('Award node not in graph: %s', award_node_id)
                     continue
                 status = award.get('status', 'nominated')
                 award_year = award.get('year')
-                edge_data = {'relationship': 'AWARD_NOMINATION', 'status': status, 'year': award_year}
-                if not self.graph.has_edge(artist_node_id, award_node_id):
-                    self.graph.add_edge(artist_node_id, award_node_id, **edge_data)
+                edge_key = (artist_node_id, award_node_id)
+                existing_edge = pending_edges.get(edge_key)
+                if existing_edge is None:
+                    existing_edge = get_edge_data(artist_node_id, award_node_id)
+                if existing_edge is None:
+                    pending_edges[edge_key] = {'relationship': 'AWARD_NOMINATION', 'status': status, 'year': award_year}
                     edges_added += 1
                 else:
-                    existing_edge = self.graph.edges[artist_node_id, award_node_id]
                     if status == 'won' and existing_edge.get('status') != 'won':
                         existing_edge['status'] = 'won'
-                    logger.debug(f'AWARD_NOMINATION edge already exists: {artist_node_id} -> {award_node_id}')
+                    logger.debug('AWARD_NOMINATION edge already exists: %s -> %s', artist_node_id, award_node_id)
+        self.graph.add_edges_from(((u, v, edge_data) for (u, v), edge_data in pending_edges.items()))
         logger.info(f'Added {edges_added} AWARD_NOMINATION relationships (Artist/Band → Award)')
         if edges_skipped > 0:
             logger.warning(f'Skipped {edges_skipped} potential relationships due to missing data')
@@ -245,137 +321,114 @@ class GraphBuilder:
         if df.empty:
             logger.warning('No songs to add')
             return
-        songs_added = 0
-        songs_without_album = 0
-        for idx, row in df.iterrows():
-            song_id = f'song_{row['id']}'
-            self.song_nodes[row['id']] = song_id
-            album_id = row.get('album_id', '')
-            if not album_id or pd.isna(album_id) or album_id == '':
-                songs_without_album += 1
-                logger.debug(f'Song {row['title']} has no album_id, skipping')
-                continue
-            if album_id not in self.graph.nodes:
-                songs_without_album += 1
-                logger.debug(f'Song {row['title']}: album {album_id} not in graph, skipping')
-                continue
-            self.graph.add_node(song_id, node_type='Song', title=row['title'], duration=row.get('duration', ''), track_number=row.get('track_number', ''), album_id=album_id, featured_artists=row.get('featured_artists', ''))
-            songs_added += 1
+        song_ids = [f'song_{song_row_id}' for song_row_id in df['id']]
+        self.song_nodes.update(zip(df['id'], song_ids))
+        songs = df.reindex(columns=['title', 'duration', 'track_number', 'album_id', 'featured_artists'], fill_value='')
+        has_album = songs['album_id'].isin(set(self.graph.nodes)).to_numpy()
+        added_song_ids = list(itertools.compress(song_ids, has_album))
+        self.graph.add_nodes_from(((song_id, {'node_type': 'Song', 'title': title, 'duration': duration, 'track_number': track_number, 'album_id': album_id, 'featured_artists': featured_artists}) for song_id, (title, duration, track_number, album_id, featured_artists) in zip(added_song_ids, songs[has_album].itertuples(index=False, name=None))))
+        self._index_nodes('Song', added_song_ids)
+        songs_added = int(has_album.sum())
+        songs_without_album = len(df) - songs_added
         logger.info(f'Added {songs_added} song nodes to graph')
         if songs_without_album > 0:
             logger.warning(f'Skipped {songs_without_album} songs without valid album nodes')
 
     def add_part_of_relationships(self, df: pd.DataFrame=None):
-        edges_added = 0
-        edges_skipped = 0
-        songs_with_track_number = 0
         if df is not None and (not df.empty):
             logger.info('Creating PART_OF relationships from provided DataFrame')
-            for idx, row in df.iterrows():
-                song_id = f'song_{row['id']}'
-                album_id = row.get('album_id', '')
-                if not album_id or pd.isna(album_id) or album_id == '':
-                    edges_skipped += 1
-                    continue
-                if song_id not in self.graph.nodes:
-                    edges_skipped += 1
-                    logger.debug(f'Song node not found: {song_id}')
-                    continue
-                if album_id not in self.graph.nodes:
-                    edges_skipped += 1
-                    logger.debug(f'Album node not found: {album_id} for song {row.get('title', 'unknown')}')
-                    continue
-                album_node_data = self.graph.nodes[album_id]
-                if album_node_data.get('node_type') != 'Album':
-                    edges_skipped += 1
-                    logger.debug(f'Node {album_id} is not an Album node')
-                    continue
-                track_number = row.get('track_number', '')
-                if track_number and str(track_number).strip() and (not pd.isna(track_number)):
-                    try:
-                        track_num = int(float(str(track_number).strip()))
-                        edge_data = {'relationship': 'PART_OF', 'track_number': track_num}
-                        songs_with_track_number += 1
-                    except (ValueError, TypeError):
-                        track_str = str(track_number).strip()
-                        if track_str:
-                            edge_data = {'relationship': 'PART_OF', 'track_number': track_str}
-                            songs_with_track_number += 1
-                        else:
-                            edge_data = {'relationship': 'PART_OF'}
-                else:
-                    edge_data = {'relationship': 'PART_OF'}
-                if not self.graph.has_edge(song_id, album_id):
-                    self.graph.add_edge(song_id, album_id, **edge_data)
-                    edges_added += 1
-                else:
-                    logger.debug(f'PART_OF edge already exists: {song_id} -> {album_id}')
+            song_ids = [f'song_{song_row_id}' for song_row_id in df['id']]
+            songs = df.reindex(columns=['album_id', 'track_number'], fill_value='')
+            album_ids = songs['album_id'].tolist()
+            track_numbers = songs['track_number'].tolist()
         else:
             logger.info('Creating PART_OF relationships from song nodes in graph')
-            song_nodes_in_graph = [node_id for node_id in self.graph.nodes() if self.graph.nodes[node_id].get('node_type') == 'Song']
-            for song_id in song_nodes_in_graph:
-                song_data = self.graph.nodes[song_id]
-                album_id = song_data.get('album_id', '')
-                if not album_id or album_id == '':
-                    edges_skipped += 1
-                    continue
-                if album_id not in self.graph.nodes:
-                    edges_skipped += 1
-                    logger.debug(f'Album node not found: {album_id} for song {song_data.get('title', 'unknown')}')
-                    continue
-                album_node_data = self.graph.nodes[album_id]
-                if album_node_data.get('node_type') != 'Album':
-                    edges_skipped += 1
-                    logger.debug(f'Node {album_id} is not an Album node')
-                    continue
-                track_number = song_data.get('track_number', '')
-                if track_number and str(track_number).strip():
-                    try:
-                        track_num = int(float(str(track_number).strip()))
-                        edge_data = {'relationship': 'PART_OF', 'track_number': track_num}
-                        songs_with_track_number += 1
-                    except (ValueError, TypeError):
-                        track_str = str(track_number).strip()
-                        if track_str:
-                            edge_data = {'relationship': 'PART_OF', 'track_number': track_str}
-                            songs_with_track_number += 1
-                        else:
-                            edge_data = {'relationship': 'PART_OF'}
-                else:
-                    edge_data = {'relationship': 'PART_OF'}
-                if not self.graph.has_edge(song_id, album_id):
-                    self.graph.add_edge(song_id, album_id, **edge_data)
-                    edges_added += 1
-                else:
-                    logger.debug(f'PART_OF edge already exists: {song_id} -> {album_id}')
+            song_nodes = self._nodes_by_type['Song']
+            song_ids = list(song_nodes)
+            album_ids = [song_data.get('album_id', '') for song_data in song_nodes.values()]
+            track_numbers = [song_data.get('track_number', '') for song_data in song_nodes.values()]
+        valid = pd.Series(album_ids, dtype=object).isin(self._nodes_by_type['Album'].keys()) & pd.Series(song_ids, dtype=object).isin(self.graph.nodes)
+        edges_skipped = len(song_ids) - int(valid.sum())
+        songs_with_track_number = 0
+        pending_edges = {}
+        has_edge = self.graph.has_edge
+        for song_id, album_id, track_number in zip(itertools.compress(song_ids, valid), itertools.compress(album_ids, valid), itertools.compress(track_numbers, valid)):
+            track_number = _parse_track_number(track_number)
+            if track_number is not None:
+                songs_with_track_number += 1
+            if has_edge(song_id, album_id) or (song_id, album_id) in pending_edges:
+                logger.debug('PART_OF edge already exists: %s -> %s', song_id, album_id)
+            else:
+                pending_edges[song_id, album_id] = track_number
+        self.graph.add_edges_from(((song_id, album_id, _PART_OF_EDGE if track_number is None else {'relationship': 'PART_OF', 'track_number': track_number}) for (song_id, album_id), track_number in pending_edges.items()))
+        edges_added = len(pending_edges)
         logger.info(f'Added {edges_added} PART_OF relationships (Song → Album)')
         logger.info(f'  - Songs with track_number: {songs_with_track_number}')
         if edges_skipped > 0:
             logger.warning(f'Skipped {edges_skipped} potential PART_OF relationships due to missing nodes or invalid data')
 
+    def _build_name_index(self):
+        artist_exact = {}
+        artist_partial = []
+        band_exact = {}
+        name_to_node = {}
+        artist_by_name = {}
+        for node_id, node_data in self._nodes_by_type['Artist'].items():
+            node_name = node_data.get('name', '')
+            if node_name:
+                artist_by_name[node_name] = node_id
+                node_name_lower = node_name.lower()
+                artist_exact.setdefault(node_name_lower, node_id)
+                artist_partial.append((node_name_lower, node_id))
+                name_to_node[node_name_lower] = node_id
+        artist_trigrams = defaultdict(set)
+        for position, (node_name_lower, _) in enumerate(artist_partial):
+            for i in range(len(node_name_lower) - 2):
+                artist_trigrams[node_name_lower[i:i + 3]].add(position)
+        for node_id, node_data in self._nodes_by_type['Band'].items():
+            node_name = node_data.get('name', '')
+            if node_name:
+                node_name_lower = node_name.lower()
+                band_exact.setdefault(node_name_lower, node_id)
+                name_to_node[node_name_lower] = node_id
+        self._name_index = {'artist_exact': artist_exact, 'artist_partial': artist_partial, 'artist_trigrams': dict(artist_trigrams), 'band_exact': band_exact, 'name_to_node': name_to_node, 'artist_by_name': artist_by_name, 'resolved': {}}
+        return self._name_index
+
     def _find_artist_by_name(self, artist_name: str) -> Optional[str]:
         if not artist_name:
             return None
-        artist_name_lower = artist_name.lower().strip()
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Artist':
-                node_name = node_data.get('name', '')
-                if node_name and node_name.lower() == artist_name_lower:
-                    return node_id
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Artist':
-                node_name = node_data.get('name', '')
-                if node_name and artist_name_lower in node_name.lower():
-                    return node_id
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Band':
-                node_name = node_data.get('name', '')
-                if node_name and node_name.lower() == artist_name_lower:
-                    return node_id
-        return None
+        name_index = self._name_index or self._build_name_index()
+        resolved = name_index['resolved']
+        if artist_name not in resolved:
+            resolved[artist_name] = self._resolve_artist_name(artist_name.lower().strip(), name_index)
+        return resolved[artist_name]
+
+    def _resolve_artist_name(self, artist_name_lower: str, name_index: Dict) -> Optional[str]:
+        artist_partial = name_index['artist_partial']
+        artist_trigrams = name_index['artist_trigrams']
+        node_id = name_index['artist_exact'].get(artist_name_lower)
+        if node_id is not None:
+            return node_id
+        if len(artist_name_lower) < 3:
+            candidates = range(len(artist_partial))
+        else:
+            trigram_positions = []
+            for i in range(len(artist_name_lower) - 2):
+                positions = artist_trigrams.get(artist_name_lower[i:i + 3])
+                if positions is None:
+                    trigram_positions = None
+                    break
+                trigram_positions.append(positions)
+            if trigram_positions is None:
+                candidates = ()
+            else:
+                trigram_positions.sort(key=len)
+                candidates = sorted(trigram_positions[0].intersection(*trigram_positions[1:]))
+        for position in candidates:
+            node_name_lower, node_id = artist_partial[position]
+            if artist_name_lower in node_name_lower:
+                return node_id
+        return name_index['band_exact'].get(artist_name_lower)
 
     def _parse_featured_artists(self, featured_artists_str: str) -> List[str]:
         if not featured_artists_str or pd.isna(featured_artists_str):
@@ -387,37 +440,24 @@ class GraphBuilder:
         return artists
 
     def add_performs_on_song_relationships(self, songs_df: pd.DataFrame=None):
+        _add_edge = self.graph.add_edge
+        has_edge = self.graph.has_edge
+        get_edge_data = self.graph.get_edge_data
         if songs_df is None or songs_df.empty:
-            song_nodes_in_graph = [node_id for node_id in self.graph.nodes() if self.graph.nodes[node_id].get('node_type') == 'Song']
+            song_nodes_in_graph = list(self._nodes_by_type['Song'])
             if not song_nodes_in_graph:
                 logger.info('No songs found in graph. Skipping PERFORMS_ON (Artist → Song) relationships.')
                 return
         else:
-            song_nodes_in_graph = []
-            for idx, row in songs_df.iterrows():
-                song_id = f'song_{row['id']}'
-                if song_id in self.graph.nodes:
-                    song_nodes_in_graph.append(song_id)
+            song_nodes_in_graph = [song_id for song_id in (f'song_{song_id}' for song_id in songs_df['id']) if song_id in self.graph]
         if not song_nodes_in_graph:
             logger.info('No songs found. Skipping PERFORMS_ON (Artist → Song) relationships.')
             return
         edges_added = 0
         edges_skipped = 0
         songs_with_featured_artists = 0
-        collaboration_edges_added = 0
-        name_to_artist_node = {}
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Artist':
-                name = node_data.get('name', '')
-                if name:
-                    name_to_artist_node[name.lower()] = node_id
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Band':
-                name = node_data.get('name', '')
-                if name:
-                    name_to_artist_node[name.lower()] = node_id
+        pair_counts = Counter()
+        name_to_artist_node = (self._name_index or self._build_name_index())['name_to_node']
         for song_id in song_nodes_in_graph:
             song_data = self.graph.nodes[song_id]
             album_id = song_data.get('album_id', '')
@@ -437,31 +477,29 @@ class GraphBuilder:
                             feat_node_id = self._find_artist_by_name(feat_name)
                         if feat_node_id:
                             featured_artist_nodes.append(feat_node_id)
-            all_artist_nodes = list(set(album_artist_nodes + featured_artist_nodes))
+            all_artist_nodes = list(dict.fromkeys(itertools.chain(album_artist_nodes, featured_artist_nodes)))
             if not all_artist_nodes:
                 edges_skipped += 1
-                logger.debug(f'Song {song_data.get('title', 'unknown')} has no associated artists')
+                logger.debug('Song %s has no associated artists', song_data.get('title', 'unknown'))
                 continue
             for artist_node_id in all_artist_nodes:
-                if not self.graph.has_edge(artist_node_id, song_id):
-                    self.graph.add_edge(artist_node_id, song_id, relationship='PERFORMS_ON')
+                if not has_edge(artist_node_id, song_id):
+                    _add_edge(artist_node_id, song_id, relationship='PERFORMS_ON')
                     edges_added += 1
                 else:
-                    logger.debug(f'PERFORMS_ON edge already exists: {artist_node_id} -> {song_id}')
-            for i, artist1 in enumerate(all_artist_nodes):
-                for artist2 in all_artist_nodes[i + 1:]:
-                    if not self.graph.has_edge(artist1, artist2):
-                        self.graph.add_edge(artist1, artist2, relationship='COLLABORATES_WITH', shared_albums=0, shared_songs=1)
-                        collaboration_edges_added += 1
-                    else:
-                        edge_data = self.graph[artist1][artist2]
-                        if edge_data.get('relationship') == 'COLLABORATES_WITH':
-                            if 'shared_songs' not in edge_data:
-                                edge_data['shared_songs'] = 0
-                            edge_data['shared_songs'] = edge_data.get('shared_songs', 0) + 1
+                    logger.debug('PERFORMS_ON edge already exists: %s -> %s', artist_node_id, song_id)
+            pair_counts.update(map(_pair_key, itertools.combinations(all_artist_nodes, 2)))
+        collaboration_edges = []
+        for (artist1, artist2), shared_songs in pair_counts.items():
+            edge_data = get_edge_data(artist1, artist2)
+            if edge_data is None:
+                collaboration_edges.append((artist1, artist2, {'relationship': 'COLLABORATES_WITH', 'shared_albums': 0, 'shared_songs': shared_songs}))
+            elif edge_data.get('relationship') == 'COLLABORATES_WITH':
+                edge_data['shared_songs'] = edge_data.get('shared_songs', 0) + shared_songs
+        self.graph.add_edges_from(collaboration_edges)
         logger.info(f'Added {edges_added} PERFORMS_ON relationships (Artist/Band → Song)')
         logger.info(f'  - Songs with featured artists: {songs_with_featured_artists}')
-        logger.info(f'  - Updated/created {collaboration_edges_added} COLLABORATES_WITH relationships from songs')
+        logger.info(f'  - Updated/created {len(collaboration_edges)} COLLABORATES_WITH relationships from songs')
         if edges_skipped > 0:
             logger.warning(f'Skipped {edges_skipped} potential PERFORMS_ON relationships due to missing artists')
 
@@ -469,11 +507,13 @@ class GraphBuilder:
         if df.empty:
             logger.warning('No genres to add')
             return
-        for idx, row in df.iterrows():
-            genre_id = row['id']
-            self.genre_nodes[genre_id] = genre_id
-            self.graph.add_node(genre_id, node_type='Genre', name=row['name'], normalized_name=row.get('normalized_name', row['name']), count=row.get('count', 0))
-        logger.info(f'Added {len(self.genre_nodes)} genre nodes to graph')
+        names = df['name']
+        normalized_names = df['normalized_name'] if 'normalized_name' in df.columns else names
+        counts = df['count'] if 'count' in df.columns else itertools.repeat(0)
+        genre_ids = df['id'].tolist()
+        self.graph.add_nodes_from(((genre_id, {'node_type': 'Genre', 'name': name, 'normalized_name': normalized_name, 'count': count}) for genre_id, name, normalized_name, count in zip(genre_ids, names, normalized_names, counts)))
+        self._index_nodes('Genre', genre_ids)
+        logger.info(f'Added {len(self._nodes_by_type['Genre'])} genre nodes to graph')
 
     def add_has_genre_relationships(self, relationships_path: str):
         try:
@@ -482,23 +522,22 @@ class GraphBuilder:
             edges_added = 0
             artist_genre_count = 0
             album_genre_count = 0
-            for idx, row in df.iterrows():
-                from_id = row['from']
-                to_id = row['to']
-                from_type = row.get('from_type', 'Artist')
-                to_type = row.get('to_type', 'Genre')
-                if from_id not in self.graph.nodes:
-                    logger.debug(f'Skipping relationship: {from_id} not in graph')
+            from_types = df['from_type'] if 'from_type' in df.columns else itertools.repeat('Artist')
+            edges = []
+            for from_id, to_id, from_type in zip(df['from'], df['to'], from_types):
+                if from_id not in self.graph:
+                    logger.debug('Skipping relationship: %s not in graph', from_id)
                     continue
-                if to_id not in self.graph.nodes:
-                    logger.debug(f'Skipping relationship: {to_id} not in graph')
+                if to_id not in self.graph:
+                    logger.debug('Skipping relationship: %s not in graph', to_id)
                     continue
-                self.graph.add_edge(from_id, to_id, relationship='HAS_GENRE')
-                edges_added += 1
+                edges.append((from_id, to_id, _HAS_GENRE_EDGE))
                 if from_type == 'Artist':
                     artist_genre_count += 1
                 elif from_type == 'Album':
                     album_genre_count += 1
+            self.graph.add_edges_from(edges)
+            edges_added = len(edges)
             logger.info(f'Added {edges_added} HAS_GENRE relationships:')
             logger.info(f'  - Artist → Genre: {artist_genre_count}')
             logger.info(f'  - Album → Genre: {album_genre_count}')
@@ -506,10 +545,15 @@ class GraphBuilder:
             logger.error(f'Error loading HAS_GENRE relationships: {e}')
 
     def add_artist_nodes(self, df: pd.DataFrame):
-        for idx, row in df.iterrows():
-            node_id = f'artist_{row['id']}'
-            self.artist_nodes[row['id']] = node_id
-            self.graph.add_node(node_id, node_type='Artist', name=row['name'], genres=row.get('genres', ''), instruments=row.get('instruments', ''), active_years=row.get('active_years', ''), url=row.get('url', ''))
+        artist_nodes = []
+        artist_columns = df.reindex(columns=['genres', 'instruments', 'active_years', 'url'], fill_value='')
+        for artist_id, name, (genres, instruments, active_years, url) in zip(df['id'], df['name'], artist_columns.itertuples(index=False, name=None)):
+            node_id = f'artist_{artist_id}'
+            self.artist_nodes[artist_id] = node_id
+            artist_nodes.append((node_id, {'node_type': 'Artist', 'name': name, 'genres': genres, 'instruments': instruments, 'active_years': active_years, 'url': url}))
+        self.graph.add_nodes_from(artist_nodes)
+        self._index_nodes('Artist', (node_id for node_id, _ in artist_nodes))
+        self._name_index = None
         logger.info(f'Added {len(self.artist_nodes)} artist nodes to graph')
 
     def add_record_label_nodes(self, df: pd.DataFrame):
@@ -519,77 +563,55 @@ class GraphBuilder:
         if 'labels' not in df.columns:
             logger.info("No 'labels' column found in data. Skipping RecordLabel node creation.")
             return
-        all_labels = set()
-        for idx, row in df.iterrows():
-            labels_str = row.get('labels', '')
-            if pd.isna(labels_str) or not labels_str:
-                continue
-            labels_str = str(labels_str).strip()
-            if not labels_str:
-                continue
-            labels = [label.strip() for label in labels_str.split(';') if label.strip()]
-            for label in labels:
-                if label:
-                    all_labels.add(label)
+        all_labels = set(_explode_labels(df)['label'])
         if not all_labels:
             logger.info('No record labels found in data')
             return
-        labels_added = 0
-        for idx, label_name in enumerate(sorted(all_labels)):
-            label_id = f'label_{idx}'
-            self.graph.add_node(label_id, node_type='RecordLabel', name=label_name)
-            self.record_label_nodes[label_name] = label_id
-            labels_added += 1
-        logger.info(f'Added {labels_added} RecordLabel nodes to graph')
+        label_nodes = [(f'label_{idx}', {'node_type': 'RecordLabel', 'name': label_name}) for idx, label_name in enumerate(sorted(all_labels))]
+        self.graph.add_nodes_from(label_nodes)
+        self._index_nodes('RecordLabel', (label_id for label_id, _ in label_nodes))
+        logger.info(f'Added {len(label_nodes)} RecordLabel nodes to graph')
 
     def add_signed_with_relationships(self, df: pd.DataFrame):
         if df.empty:
             logger.warning('No artist data provided for SIGNED_WITH relationship creation')
             return
-        if not self.record_label_nodes:
+        record_label_nodes = self.record_label_nodes
+        if not record_label_nodes:
             logger.warning('No RecordLabel nodes found. Call add_record_label_nodes() first.')
             return
         if 'labels' not in df.columns:
             logger.info("No 'labels' column found in data. Skipping SIGNED_WITH relationship creation.")
             return
-        edges_added = 0
         edges_skipped = 0
-        for idx, row in df.iterrows():
-            artist_id = row['id']
+        pending_edges = {}
+        has_edge = self.graph.has_edge
+        labels = _explode_labels(df)
+        for artist_id, label_name in zip(labels['id'], labels['label']):
             artist_node_id = self.artist_nodes.get(artist_id)
             if not artist_node_id:
-                logger.debug(f'Artist node not found for artist ID: {artist_id}')
+                logger.debug('Artist node not found for artist ID: %s', artist_id)
                 edges_skipped += 1
                 continue
-            if artist_node_id not in self.graph.nodes:
-                logger.debug(f'Artist node not in graph: {artist_node_id}')
+            if artist_node_id not in self.graph:
+                logger.debug('Artist node not in graph: %s', artist_node_id)
                 edges_skipped += 1
                 continue
-            labels_str = row.get('labels', '')
-            if pd.isna(labels_str) or not labels_str:
+            label_node_id = record_label_nodes.get(label_name)
+            if not label_node_id:
+                logger.debug('RecordLabel node not found for label: %s', label_name)
+                edges_skipped += 1
                 continue
-            labels_str = str(labels_str).strip()
-            if not labels_str:
+            if label_node_id not in self.graph:
+                logger.debug('RecordLabel node not in graph: %s', label_node_id)
+                edges_skipped += 1
                 continue
-            labels = [label.strip() for label in labels_str.split(';') if label.strip()]
-            for label_name in labels:
-                if not label_name:
-                    continue
-                label_node_id = self.record_label_nodes.get(label_name)
-                if not label_node_id:
-                    logger.debug(f'RecordLabel node not found for label: {label_name}')
-                    edges_skipped += 1
-                    continue
-                if label_node_id not in self.graph.nodes:
-                    logger.debug(f'RecordLabel node not in graph: {label_node_id}')
-                    edges_skipped += 1
-                    continue
-                if not self.graph.has_edge(artist_node_id, label_node_id):
-                    self.graph.add_edge(artist_node_id, label_node_id, relationship='SIGNED_WITH')
-                    edges_added += 1
-                else:
-                    logger.debug(f'SIGNED_WITH edge already exists: {artist_node_id} -> {label_node_id}')
-        logger.info(f'Added {edges_added} SIGNED_WITH relationships')
+            if not has_edge(artist_node_id, label_node_id) and (artist_node_id, label_node_id) not in pending_edges:
+                pending_edges[artist_node_id, label_node_id] = _SIGNED_WITH_EDGE
+            else:
+                logger.debug('SIGNED_WITH edge already exists: %s -> %s', artist_node_id, label_node_id)
+        self.graph.add_edges_from(((u, v, edge_data) for (u, v), edge_data in pending_edges.items()))
+        logger.info(f'Added {len(pending_edges)} SIGNED_WITH relationships')
         if edges_skipped > 0:
             logger.warning(f'Skipped {edges_skipped} potential SIGNED_WITH relationships due to missing nodes')
 
@@ -601,15 +623,8 @@ class GraphBuilder:
         if not bands:
             logger.info('No bands found in classifications')
             return
-        name_to_url = {}
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Artist':
-                name = node_data.get('name', '')
-                url = node_data.get('url', '')
-                if name:
-                    name_to_url[name] = url
-        bands_added = 0
+        artist_by_name = (self._name_index or self._build_name_index())['artist_by_name']
+        band_nodes = []
         bands_skipped = 0
         for idx, band_class in enumerate(bands):
             band_name = band_class.get('name', '')
@@ -617,46 +632,45 @@ class GraphBuilder:
                 bands_skipped += 1
                 continue
             band_id = f'band_{idx}'
-            url = name_to_url.get(band_name, '')
+            artist_node_id = artist_by_name.get(band_name)
+            url = self.graph.nodes[artist_node_id].get('url', '') if artist_node_id else ''
             confidence = band_class.get('confidence', 0.0)
-            self.graph.add_node(band_id, node_type='Band', name=band_name, url=url, classification_confidence=confidence)
-            self.band_nodes[band_name] = band_id
-            bands_added += 1
-        logger.info(f'Added {bands_added} Band nodes to graph')
+            band_nodes.append((band_id, {'node_type': 'Band', 'name': band_name, 'url': url, 'classification_confidence': confidence}))
+        self.graph.add_nodes_from(band_nodes)
+        self._index_nodes('Band', (band_id for band_id, _ in band_nodes))
+        self._name_index = None
+        logger.info(f'Added {len(band_nodes)} Band nodes to graph')
         if bands_skipped > 0:
             logger.warning(f'Skipped {bands_skipped} bands due to missing name')
 
     def add_member_of_relationships(self, classifications: List[Dict]=None, members_map: Dict[str, List[str]]=None):
-        if not self.band_nodes:
+        band_nodes = self.band_nodes
+        if not band_nodes:
             logger.warning('No Band nodes found. Call add_band_nodes() first.')
             return
         edges_added = 0
         edges_skipped = 0
-        name_to_artist_node = {}
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Artist':
-                name = node_data.get('name', '')
-                if name:
-                    name_to_artist_node[name] = node_id
+        _add_edge = self.graph.add_edge
+        has_edge = self.graph.has_edge
+        name_to_artist_node = (self._name_index or self._build_name_index())['artist_by_name']
         if members_map:
             logger.info(f'Creating MEMBER_OF relationships from members_map ({len(members_map)} bands)')
             for band_name, members in members_map.items():
-                band_id = self.band_nodes.get(band_name)
+                band_id = band_nodes.get(band_name)
                 if not band_id:
-                    logger.debug(f'Band node not found: {band_name}')
+                    logger.debug('Band node not found: %s', band_name)
                     continue
                 for member_name in members:
                     artist_node_id = name_to_artist_node.get(member_name)
                     if not artist_node_id:
-                        logger.debug(f'Artist node not found for member: {member_name}')
+                        logger.debug('Artist node not found for member: %s', member_name)
                         edges_skipped += 1
                         continue
-                    if not self.graph.has_edge(artist_node_id, band_id):
-                        self.graph.add_edge(artist_node_id, band_id, relationship='MEMBER_OF')
+                    if not has_edge(artist_node_id, band_id):
+                        _add_edge(artist_node_id, band_id, relationship='MEMBER_OF')
                         edges_added += 1
                     else:
-                        logger.debug(f'MEMBER_OF edge already exists: {member_name} -> {band_name}')
+                        logger.debug('MEMBER_OF edge already exists: %s -> %s', member_name, band_name)
         elif classifications:
             logger.info('Creating MEMBER_OF relationships from classifications (simplified approach)')
             logger.warning('Note: Full member parsing from infobox not yet implemented. Using simplified 1-to-1 mapping based on classification.')
@@ -666,90 +680,76 @@ class GraphBuilder:
                 band_name = classification.get('name', '')
                 if not band_name:
                     continue
-                band_id = self.band_nodes.get(band_name)
+                band_id = band_nodes.get(band_name)
                 if not band_id:
                     continue
                 artist_node_id = name_to_artist_node.get(band_name)
                 if not artist_node_id:
-                    logger.debug(f'Artist node not found for band: {band_name}')
+                    logger.debug('Artist node not found for band: %s', band_name)
                     edges_skipped += 1
                     continue
-                if not self.graph.has_edge(artist_node_id, band_id):
-                    self.graph.add_edge(artist_node_id, band_id, relationship='MEMBER_OF')
+                if not has_edge(artist_node_id, band_id):
+                    _add_edge(artist_node_id, band_id, relationship='MEMBER_OF')
                     edges_added += 1
         logger.info(f'Added {edges_added} MEMBER_OF relationships')
         if edges_skipped > 0:
             logger.warning(f'Skipped {edges_skipped} potential MEMBER_OF relationships due to missing nodes')
 
     def add_album_nodes_and_edges(self, album_map: Dict):
-        edges_added = 0
-        collaboration_edges = 0
-        sorted_albums = sorted(album_map.items())
-        album_idx = 0
-        for album_title, artist_ids in sorted_albums:
+        pair_counts = Counter()
+        album_nodes = []
+        album_edges = []
+        for album_title, artist_ids in sorted(album_map.items()):
             if len(artist_ids) < 2:
                 continue
-            album_id = f'album_{album_idx}'
-            album_idx += 1
-            self.album_nodes[album_title] = album_id
-            self.graph.add_node(album_id, node_type='Album', title=album_title)
-            valid_artist_nodes = []
-            for artist_id in artist_ids:
-                artist_node_id = self.artist_nodes.get(artist_id)
-                if artist_node_id:
-                    self.graph.add_edge(artist_node_id, album_id, relationship='PERFORMS_ON')
-                    edges_added += 1
-                    valid_artist_nodes.append(artist_node_id)
+            album_id = f'album_{len(album_nodes)}'
+            album_nodes.append((album_id, {'node_type': 'Album', 'title': album_title}))
+            valid_artist_nodes = [artist_node_id for artist_node_id in map(self.artist_nodes.get, artist_ids) if artist_node_id]
+            album_edges.extend(((artist_node_id, album_id, _PERFORMS_ON_EDGE) for artist_node_id in valid_artist_nodes))
             self.album_id_to_artists[album_id] = valid_artist_nodes
-            for i, artist1 in enumerate(valid_artist_nodes):
-                for artist2 in valid_artist_nodes[i + 1:]:
-                    if not self.graph.has_edge(artist1, artist2):
-                        self.graph.add_edge(artist1, artist2, relationship='COLLABORATES_WITH', shared_albums=1, shared_songs=0)
-                        collaboration_edges += 1
-                    else:
-                        edge_data = self.graph[artist1][artist2]
-                        if edge_data.get('relationship') == 'COLLABORATES_WITH':
-                            edge_data['shared_albums'] = edge_data.get('shared_albums', 0) + 1
-                            if 'shared_songs' not in edge_data:
-                                edge_data['shared_songs'] = 0
-        logger.info(f'Added {len(self.album_nodes)} album nodes')
+            pair_counts.update(map(_pair_key, itertools.combinations(valid_artist_nodes, 2)))
+        self.graph.add_nodes_from(album_nodes)
+        self._index_nodes('Album', (album_id for album_id, _ in album_nodes))
+        self.graph.add_edges_from(album_edges)
+        edges_added = len(album_edges)
+        collaboration_edges = []
+        get_edge_data = self.graph.get_edge_data
+        for (artist1, artist2), shared_albums in pair_counts.items():
+            edge_data = get_edge_data(artist1, artist2)
+            if edge_data is None:
+                collaboration_edges.append((artist1, artist2, {'relationship': 'COLLABORATES_WITH', 'shared_albums': shared_albums, 'shared_songs': 0}))
+            elif edge_data.get('relationship') == 'COLLABORATES_WITH':
+                edge_data['shared_albums'] = edge_data.get('shared_albums', 0) + shared_albums
+                if 'shared_songs' not in edge_data:
+                    edge_data['shared_songs'] = 0
+        self.graph.add_edges_from(collaboration_edges)
+        logger.info(f'Added {len(self._nodes_by_type['Album'])} album nodes')
         logger.info(f'Added {edges_added} artist-album edges')
-        logger.info(f'Added {collaboration_edges} artist-artist collaboration edges')
+        logger.info(f'Added {len(collaboration_edges)} artist-artist collaboration edges')
 
     def create_similar_genre_edges(self, similarity_threshold: float=0.3):
         logger.info('Creating SIMILAR_GENRE edges...')
         edges_added = 0
-        artist_nodes_list = list(self.artist_nodes.values())
-        for i, artist1_id in enumerate(artist_nodes_list):
-            artist1 = self.graph.nodes[artist1_id]
-            genres1_str = artist1.get('genres', '')
-            if pd.isna(genres1_str) or not genres1_str:
-                continue
-            genres1_str = str(genres1_str)
-            if not genres1_str.strip():
-                continue
-            genres1 = set((g.lower().strip() for g in genres1_str.split(';') if g.strip()))
-            if not genres1:
-                continue
-            for artist2_id in artist_nodes_list[i + 1:]:
-                artist2 = self.graph.nodes[artist2_id]
-                genres2_str = artist2.get('genres', '')
-                if pd.isna(genres2_str) or not genres2_str:
-                    continue
-                genres2_str = str(genres2_str)
-                if not genres2_str.strip():
-                    continue
-                genres2 = set((g.lower().strip() for g in genres2_str.split(';') if g.strip()))
-                if not genres2:
-                    continue
-                common_genres = genres1.intersection(genres2)
-                all_genres = genres1.union(genres2)
-                if len(common_genres) > 0 and len(all_genres) > 0:
-                    similarity = len(common_genres) / len(all_genres)
-                    if similarity >= similarity_threshold:
-                        if not self.graph.has_edge(artist1_id, artist2_id):
-                            self.graph.add_edge(artist1_id, artist2_id, relationship='SIMILAR_GENRE', similarity=round(similarity, 3))
-                            edges_added += 1
+        artist_node_ids = list(self.artist_nodes.values())
+        genres = pd.Series([self.graph.nodes[artist_id].get('genres', '') for artist_id in artist_node_ids], dtype=object)
+        genres = genres[genres.notna() & genres.astype(bool)].astype(str).str.lower().str.split(';').explode().str.strip()
+        genres = genres[genres != '']
+        artist_genres = pd.DataFrame({'artist': genres.index.to_numpy(), 'genre': genres.to_numpy()}).drop_duplicates()
+        rows, artist_positions = pd.factorize(artist_genres['artist'])
+        columns, genre_names = pd.factorize(artist_genres['genre'])
+        artist_ids = [artist_node_ids[position] for position in artist_positions]
+        if len(artist_ids) > 1:
+            incidence = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)), shape=(len(artist_ids), len(genre_names)))
+            sizes = np.diff(incidence.indptr)
+            common = sparse.triu(incidence @ incidence.T, k=1).tocoo()
+            similarities = common.data / (sizes[common.row] + sizes[common.col] - common.data)
+            keep = similarities >= similarity_threshold
+            pair_rows, pair_columns, similarities = (common.row[keep], common.col[keep], similarities[keep])
+            order = np.lexsort((pair_columns, pair_rows))
+            has_edge = self.graph.has_edge
+            similar_edges = [(artist_ids[i], artist_ids[j], {'relationship': 'SIMILAR_GENRE', 'similarity': round(similarity, 3)}) for i, j, similarity in zip(pair_rows[order].tolist(), pair_columns[order].tolist(), similarities[order].tolist()) if not has_edge(artist_ids[i], artist_ids[j])]
+            self.graph.add_edges_from(similar_edges)
+            edges_added = len(similar_edges)
         logger.info(f'Added {edges_added} SIMILAR_GENRE edges')
         return edges_added
 
@@ -778,62 +778,60 @@ class GraphBuilder:
         return self.graph
 
     def export_edges_csv(self, output_path: str):
-        edges_data = []
-        for u, v, data in self.graph.edges(data=True):
-            edge_record = {'from': u, 'to': v, 'type': data.get('relationship', 'PERFORMS_ON')}
+        edge_count = self.graph.number_of_edges()
+        columns = {'from': [None] * edge_count, 'to': [None] * edge_count, 'type': [None] * edge_count}
+        from_col = columns['from']
+        to_col = columns['to']
+        type_col = columns['type']
+
+        def column(name):
+            values = columns.get(name)
+            if values is None:
+                values = columns[name] = [np.nan] * edge_count
+            return values
+        performs_on_types = Counter()
+        for k, (u, v, data) in enumerate(self.graph.edges(data=True)):
             relationship = data.get('relationship', 'PERFORMS_ON')
+            from_col[k] = u
+            to_col[k] = v
+            type_col[k] = relationship
             if relationship == 'COLLABORATES_WITH':
                 shared_albums = data.get('shared_albums', 0)
                 shared_songs = data.get('shared_songs', 0)
-                edge_record['weight'] = shared_albums + shared_songs
-                edge_record['shared_albums'] = shared_albums
-                edge_record['shared_songs'] = shared_songs
+                column('weight')[k] = shared_albums + shared_songs
+                column('shared_albums')[k] = shared_albums
+                column('shared_songs')[k] = shared_songs
             elif relationship == 'SIMILAR_GENRE':
-                edge_record['weight'] = data.get('similarity', 0.5)
+                column('weight')[k] = data.get('similarity', 0.5)
             elif relationship == 'PART_OF':
                 track_number = data.get('track_number')
                 if track_number is not None:
-                    edge_record['track_number'] = track_number
-                edge_record['weight'] = 1
+                    column('track_number')[k] = track_number
+                column('weight')[k] = 1
             elif relationship == 'AWARD_NOMINATION':
                 status = data.get('status')
                 if status is not None:
-                    edge_record['status'] = status
+                    column('status')[k] = status
                 year = data.get('year')
                 if year is not None:
-                    edge_record['year'] = year
-                edge_record['weight'] = 1
+                    column('year')[k] = year
+                column('weight')[k] = 1
             else:
-                edge_record['weight'] = 1
-            edges_data.append(edge_record)
-        df = pd.DataFrame(edges_data)
+                column('weight')[k] = 1
+                if relationship == 'PERFORMS_ON':
+                    performs_on_types[self.graph.nodes[u].get('node_type', ''), self.graph.nodes[v].get('node_type', '')] += 1
+        df = pd.DataFrame(columns)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        df.to_csv(output_path, index=False, encoding='utf-8')
-        type_counts = df['type'].value_counts().to_dict()
-        logger.info(f'Exported {len(edges_data)} edges to {output_path}')
-        for edge_type, count in type_counts.items():
+        df.to_csv(output_path, index=False, encoding='utf-8', chunksize=self.csv_chunksize)
+        type_counts = Counter(type_col)
+        logger.info(f'Exported {edge_count} edges to {output_path}')
+        for edge_type, count in type_counts.most_common():
             logger.info(f'  - {edge_type}: {count}')
         if 'PERFORMS_ON' in type_counts:
-            performs_on_edges = df[df['type'] == 'PERFORMS_ON']
-            artist_to_album = 0
-            artist_to_song = 0
-            band_to_album = 0
-            band_to_song = 0
-            for _, row in performs_on_edges.iterrows():
-                from_node = row['from']
-                to_node = row['to']
-                from_type = self.graph.nodes.get(from_node, {}).get('node_type', '')
-                to_type = self.graph.nodes.get(to_node, {}).get('node_type', '')
-                if from_type == 'Artist':
-                    if to_type == 'Album':
-                        artist_to_album += 1
-                    elif to_type == 'Song':
-                        artist_to_song += 1
-                elif from_type == 'Band':
-                    if to_type == 'Album':
-                        band_to_album += 1
-                    elif to_type == 'Song':
-                        band_to_song += 1
+            artist_to_album = performs_on_types['Artist', 'Album']
+            artist_to_song = performs_on_types['Artist', 'Song']
+            band_to_album = performs_on_types['Band', 'Album']
+            band_to_song = performs_on_types['Band', 'Song']
             logger.info(f'  PERFORMS_ON breakdown:')
             if artist_to_album > 0:
                 logger.info(f'    - Artist → Album: {artist_to_album}')
@@ -844,28 +842,20 @@ class GraphBuilder:
             if band_to_song > 0:
                 logger.info(f'    - Band → Song: {band_to_song}')
         if 'PART_OF' in type_counts:
-            part_of_edges = df[df['type'] == 'PART_OF']
             tracks_with_number = 0
-            if 'track_number' in part_of_edges.columns:
-                tracks_with_number = part_of_edges['track_number'].notna().sum()
+            if 'track_number' in columns:
+                tracks_with_number = df['track_number'].notna().sum()
             logger.info(f'  PART_OF breakdown:')
-            logger.info(f'    - Total: {len(part_of_edges)}')
+            logger.info(f'    - Total: {type_counts['PART_OF']}')
             logger.info(f'    - With track_number: {tracks_with_number}')
         if 'AWARD_NOMINATION' in type_counts:
-            award_nomination_edges = df[df['type'] == 'AWARD_NOMINATION']
-            with_status = 0
-            with_year = 0
-            if 'status' in award_nomination_edges.columns:
-                with_status = award_nomination_edges['status'].notna().sum()
-            if 'year' in award_nomination_edges.columns:
-                with_year = award_nomination_edges['year'].notna().sum()
-            won_count = 0
-            nominated_count = 0
-            if 'status' in award_nomination_edges.columns:
-                won_count = (award_nomination_edges['status'] == 'won').sum()
-                nominated_count = (award_nomination_edges['status'] == 'nominated').sum()
+            status_counts = df['status'].value_counts() if 'status' in columns else pd.Series(dtype=int)
+            with_status = status_counts.sum()
+            won_count = status_counts.get('won', 0)
+            nominated_count = status_counts.get('nominated', 0)
+            with_year = df['year'].notna().sum() if 'year' in columns else 0
             logger.info(f'  AWARD_NOMINATION breakdown:')
-            logger.info(f'    - Total: {len(award_nomination_edges)}')
+            logger.info(f'    - Total: {type_counts['AWARD_NOMINATION']}')
             if with_status > 0:
                 logger.info(f'    - With status: {with_status}')
                 if won_count > 0:
@@ -877,101 +867,65 @@ class GraphBuilder:
 
     def export_has_genre_relationships_csv(self, relationships_path: str, output_path: str):
         try:
-            df = pd.read_csv(relationships_path, encoding='utf-8')
-            edges_data = []
-            for idx, row in df.iterrows():
-                edges_data.append({'from': row['from'], 'to': row['to'], 'type': 'HAS_GENRE', 'weight': 1})
-            df_edges = pd.DataFrame(edges_data)
+            df_edges = pd.read_csv(relationships_path, usecols=['from', 'to'], encoding='utf-8')[['from', 'to']]
+            df_edges['type'] = 'HAS_GENRE'
+            df_edges['weight'] = 1
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            df_edges.to_csv(output_path, index=False, encoding='utf-8')
-            logger.info(f'Exported {len(edges_data)} HAS_GENRE relationships to {output_path}')
+            df_edges.to_csv(output_path, index=False, encoding='utf-8', chunksize=self.csv_chunksize)
+            logger.info(f'Exported {len(df_edges)} HAS_GENRE relationships to {output_path}')
         except Exception as e:
             logger.error(f'Error exporting HAS_GENRE relationships: {e}')
 
+    def _node_frame(self, node_type: str, node_ids: Iterable[str]) -> pd.DataFrame:
+        node_ids = list(node_ids)
+        node_attrs = [self.graph.nodes[node_id] for node_id in node_ids]
+        columns = {'id': node_ids}
+        for field, default in _EXPORT_FIELDS[node_type]:
+            columns[field] = [attrs.get(field, default) for attrs in node_attrs]
+        return pd.DataFrame(columns)
+
     def export_nodes_for_neo4j(self, output_dir: str):
         os.makedirs(output_dir, exist_ok=True)
-        artist_data = []
-        for node_id in self.artist_nodes.values():
-            node_attrs = self.graph.nodes[node_id]
-            artist_data.append({'id': node_id, 'name': node_attrs.get('name', ''), 'genres': node_attrs.get('genres', ''), 'instruments': node_attrs.get('instruments', ''), 'active_years': node_attrs.get('active_years', ''), 'url': node_attrs.get('url', '')})
-        df_artists = pd.DataFrame(artist_data)
-        df_artists.to_csv(f'{output_dir}/artists.csv', index=False, encoding='utf-8')
-        logger.info(f'Exported {len(artist_data)} artists to {output_dir}/artists.csv')
-        album_data = []
-        for node_id in self.album_nodes.values():
-            node_attrs = self.graph.nodes[node_id]
-            album_data.append({'id': node_id, 'title': node_attrs.get('title', '')})
-        df_albums = pd.DataFrame(album_data)
-        df_albums.to_csv(f'{output_dir}/albums.csv', index=False, encoding='utf-8')
-        logger.info(f'Exported {len(album_data)} albums to {output_dir}/albums.csv')
-        if self.genre_nodes:
-            genre_data = []
-            for genre_id in self.genre_nodes.values():
-                node_attrs = self.graph.nodes[genre_id]
-                genre_data.append({'id': genre_id, 'name': node_attrs.get('name', ''), 'normalized_name': node_attrs.get('normalized_name', ''), 'count': node_attrs.get('count', 0)})
-            df_genres = pd.DataFrame(genre_data)
-            df_genres.to_csv(f'{output_dir}/genres.csv', index=False, encoding='utf-8')
-            logger.info(f'Exported {len(genre_data)} genres to {output_dir}/genres.csv')
-        if self.band_nodes:
-            band_data = []
-            for band_id in self.band_nodes.values():
-                node_attrs = self.graph.nodes[band_id]
-                band_data.append({'id': band_id, 'name': node_attrs.get('name', ''), 'url': node_attrs.get('url', ''), 'classification_confidence': node_attrs.get('classification_confidence', 0.0)})
-            df_bands = pd.DataFrame(band_data)
-            df_bands.to_csv(f'{output_dir}/bands.csv', index=False, encoding='utf-8')
-            logger.info(f'Exported {len(band_data)} bands to {output_dir}/bands.csv')
-        if self.record_label_nodes:
-            label_data = []
-            for label_id in self.record_label_nodes.values():
-                node_attrs = self.graph.nodes[label_id]
-                label_data.append({'id': label_id, 'name': node_attrs.get('name', '')})
-            df_labels = pd.DataFrame(label_data)
-            df_labels.to_csv(f'{output_dir}/record_labels.csv', index=False, encoding='utf-8')
-            logger.info(f'Exported {len(label_data)} record labels to {output_dir}/record_labels.csv')
+        exports = [(self._node_frame('Artist', self.artist_nodes.values()), 'artists.csv', 'artists'), (self._node_frame('Album', self.album_nodes.values()), 'albums.csv', 'albums')]
+        genre_nodes = self.genre_nodes
+        if genre_nodes:
+            exports.append((self._node_frame('Genre', genre_nodes.values()), 'genres.csv', 'genres'))
+        band_nodes = self.band_nodes
+        if band_nodes:
+            exports.append((self._node_frame('Band', band_nodes.values()), 'bands.csv', 'bands'))
+        record_label_nodes = self.record_label_nodes
+        if record_label_nodes:
+            exports.append((self._node_frame('RecordLabel', record_label_nodes.values()), 'record_labels.csv', 'record labels'))
         else:
             logger.info('No record labels to export (record_labels.csv not created)')
-        song_data = []
-        song_ids_to_export = set()
-        if self.song_nodes:
-            for song_id in self.song_nodes.values():
-                if song_id in self.graph.nodes:
-                    song_ids_to_export.add(song_id)
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Song':
-                song_ids_to_export.add(node_id)
-        for song_id in song_ids_to_export:
-            node_attrs = self.graph.nodes[song_id]
-            song_data.append({'id': song_id, 'title': node_attrs.get('title', ''), 'duration': node_attrs.get('duration', ''), 'track_number': node_attrs.get('track_number', ''), 'album_id': node_attrs.get('album_id', ''), 'featured_artists': node_attrs.get('featured_artists', '')})
-        if song_data:
-            df_songs = pd.DataFrame(song_data)
-            df_songs.to_csv(f'{output_dir}/songs.csv', index=False, encoding='utf-8')
-            logger.info(f'Exported {len(song_data)} songs to {output_dir}/songs.csv')
+        song_ids_to_export = dict.fromkeys((song_id for song_id in self.song_nodes.values() if song_id in self.graph))
+        award_ids_to_export = dict.fromkeys((award_id for award_id in self.award_nodes.values() if award_id in self.graph))
+        for node_id, node_data in self.graph.nodes(data=True):
+            node_type = node_data.get('node_type')
+            if node_type == 'Song':
+                song_ids_to_export[node_id] = None
+            elif node_type == 'Award':
+                award_ids_to_export[node_id] = None
+        if song_ids_to_export:
+            exports.append((self._node_frame('Song', song_ids_to_export), 'songs.csv', 'songs'))
         else:
             logger.info('No songs to export (songs.csv not created)')
-        award_data = []
-        award_ids_to_export = set()
-        if self.award_nodes:
-            for award_id in self.award_nodes.values():
-                if award_id in self.graph.nodes:
-                    award_ids_to_export.add(award_id)
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            if node_data.get('node_type') == 'Award':
-                award_ids_to_export.add(node_id)
-        for award_id in award_ids_to_export:
-            node_attrs = self.graph.nodes[award_id]
-            award_data.append({'id': award_id, 'name': node_attrs.get('name', ''), 'ceremony': node_attrs.get('ceremony', ''), 'category': node_attrs.get('category', ''), 'year': node_attrs.get('year', '')})
-        if award_data:
-            df_awards = pd.DataFrame(award_data)
-            df_awards.to_csv(f'{output_dir}/awards.csv', index=False, encoding='utf-8')
-            logger.info(f'Exported {len(award_data)} awards to {output_dir}/awards.csv')
+        if award_ids_to_export:
+            exports.append((self._node_frame('Award', award_ids_to_export), 'awards.csv', 'awards'))
         else:
             logger.info('No awards to export (awards.csv not created)')
+        with ThreadPoolExecutor(max_workers=_EXPORT_WORKERS) as executor:
+            list(executor.map(lambda export: export[0].to_csv(f'{output_dir}/{export[1]}', index=False, encoding='utf-8', chunksize=self.csv_chunksize), exports))
+        for df_nodes, file_name, label in exports:
+            logger.info(f'Exported {len(df_nodes)} {label} to {output_dir}/{file_name}')
 
     def save_graph(self, output_path: str):
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        nx.write_graphml(self.graph, output_path)
+        if output_path.endswith('.pkl'):
+            with open(output_path, 'wb') as f:
+                pickle.dump(self.graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            nx.write_graphml(self.graph, output_path)
         logger.info(f'Saved graph to {output_path}')
 
 def build_graph(nodes_path: str='data/processed/nodes.csv', albums_path: str='data/processed/albums.json', output_dir: str='data/processed', genres_path: str=None, has_genre_path: str=None, band_classifications_path: str=None, songs_path: str=None, awards_csv_path: str=None, awards_json_path: str=None) -> int: